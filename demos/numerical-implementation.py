@@ -1,6 +1,16 @@
+import json
+import os
 import numpy as np
+from pathlib import Path
 from scipy.integrate import solve_ivp
-from typing import NamedTuple, Tuple, List
+from typing import NamedTuple, Tuple, List, Optional, Dict, Union
+
+# Critical dimensions of the n-ball framework (as in nballs.core.NBallCore)
+CRITICAL_POINTS = {
+    'volume_max': 5.256946,   # ~τ-1 region
+    'freedom_max': 6.118750,  # ~τ region
+    'surface_max': 7.256946   # ~τ+1 region
+}
 
 class PhaseState(NamedTuple):
     """Complete phase space state."""
@@ -30,6 +40,122 @@ def phase_evolution(state: PhaseState, dt: float) -> PhaseState:
 
     return PhaseState(q_new, p_new, phase_new, dim_new)
 
+class EnsembleState(NamedTuple):
+    """Phase space states of N trajectories stacked along axis 0."""
+    q: np.ndarray          # (N, k) position coordinates
+    p: np.ndarray          # (N, k) momentum coordinates
+    phase: np.ndarray      # (N,) current phases
+    dimension: np.ndarray  # (N,) current dimensions
+
+class EnsembleTrajectory(NamedTuple):
+    """Recorded ensemble snapshots, one row per recorded step."""
+    step: np.ndarray       # (T,) step index of each snapshot
+    q: np.ndarray          # (T, N, k)
+    p: np.ndarray          # (T, N, k)
+    phase: np.ndarray      # (T, N)
+    dimension: np.ndarray  # (T, N)
+
+def stack_states(states: List[PhaseState]) -> EnsembleState:
+    """Stack individual phase states into an ensemble."""
+    return EnsembleState(
+        np.array([s.q for s in states], dtype=float),
+        np.array([s.p for s in states], dtype=float),
+        np.array([s.phase for s in states], dtype=float),
+        np.array([s.dimension for s in states], dtype=float))
+
+def unstack_states(ensemble: EnsembleState) -> List[PhaseState]:
+    """Split an ensemble back into individual phase states."""
+    return [PhaseState(q, p, phase, dim) for q, p, phase, dim in
+            zip(ensemble.q, ensemble.p, ensemble.phase.tolist(), ensemble.dimension.tolist())]
+
+def compute_hamiltonians(ensemble: EnsembleState) -> np.ndarray:
+    """Compute the Hamiltonian of every ensemble member at once."""
+    return ((np.sum(ensemble.p**2, axis=-1) / 2 + np.sum(ensemble.q**2, axis=-1) / 2)
+            * np.exp(-ensemble.dimension**2/4*np.pi))
+
+def allocate_trajectory(ensemble: EnsembleState, records: int) -> EnsembleTrajectory:
+    """Preallocate buffers for a number of ensemble snapshots."""
+    n, k = ensemble.q.shape
+    return EnsembleTrajectory(
+        np.zeros(records, dtype=int),
+        np.empty((records, n, k)), np.empty((records, n, k)),
+        np.empty((records, n)), np.empty((records, n)))
+
+def integrate_ensemble(ensemble: EnsembleState, dt: float, steps: int,
+                       record_every: int = 1,
+                       trajectory: Optional[EnsembleTrajectory] = None,
+                       monitor: Optional['StabilityMonitor'] = None
+                       ) -> Tuple[EnsembleState, EnsembleTrajectory]:
+    """Advance N trajectories by steps of phase_evolution at once.
+
+    Each step is the same kick-drift-kick update as phase_evolution, applied
+    in place to stacked (N, k) arrays, with the phase driven by the
+    Hamiltonian of the state at the start of the step. The initial state and
+    every record_every-th state are written into trajectory, which is
+    allocated when not given and may be reused across runs.
+
+    A StabilityMonitor receives every state along with the Hamiltonian
+    already computed for the step. The run stops early once no ensemble
+    member is stable any more, and the returned trajectory is then cut to
+    the records written so far.
+    """
+    q, p = ensemble.q.astype(float), ensemble.p.astype(float)
+    phase, dim = ensemble.phase.astype(float), ensemble.dimension.astype(float)
+    records = steps // record_every + 1
+    if trajectory is None:
+        trajectory = allocate_trajectory(ensemble, records)
+    elif len(trajectory.step) < records:
+        raise ValueError(f"Trajectory holds {len(trajectory.step)} records, need {records}")
+
+    kick, tmp = 0.5 * dt, np.empty_like(q)
+    H, new_phase = np.empty_like(phase), np.empty_like(phase)
+
+    def record(row: int, step: int):
+        trajectory.step[row] = step
+        trajectory.q[row], trajectory.p[row] = q, p
+        trajectory.phase[row], trajectory.dimension[row] = phase, dim
+
+    record(0, 0)
+    for step in range(1, steps + 1):
+        # Phase velocity from the pre-step Hamiltonian
+        np.multiply(p, p, out=tmp)
+        H[:] = np.sum(tmp, axis=1) / 2
+        np.multiply(q, q, out=tmp)
+        H += np.sum(tmp, axis=1) / 2
+        H *= np.exp(-dim**2/4*np.pi)
+        if monitor is not None and not np.any(monitor.update(phase, H, dim)):
+            return _stopped(q, p, phase, dim, trajectory, step - 1, record_every)
+
+        # Symplectic kick-drift-kick
+        np.multiply(kick, q, out=tmp)
+        p -= tmp
+        np.multiply(dt, p, out=tmp)
+        q += tmp
+        np.multiply(kick, q, out=tmp)
+        p -= tmp
+
+        # Phase and dimensional evolution
+        np.multiply(dt, H, out=new_phase)
+        new_phase += phase
+        dim += dt * np.sin(new_phase - phase)
+        phase, new_phase = new_phase, phase
+
+        if step % record_every == 0:
+            record(step // record_every, step)
+
+    final = EnsembleState(q, p, phase, dim)
+    if monitor is not None:
+        monitor.update(phase, compute_hamiltonians(final), dim)
+    return final, EnsembleTrajectory(*(buffer[:records] for buffer in trajectory))
+
+def _stopped(q: np.ndarray, p: np.ndarray, phase: np.ndarray, dim: np.ndarray,
+             trajectory: EnsembleTrajectory, step: int,
+             record_every: int) -> Tuple[EnsembleState, EnsembleTrajectory]:
+    """Result of a run stopped after step, with the trajectory cut to match."""
+    rows = step // record_every + 1
+    return (EnsembleState(q, p, phase, dim),
+            EnsembleTrajectory(*(buffer[:rows] for buffer in trajectory)))
+
 def compute_interference_pattern(states: List[PhaseState]) -> np.ndarray:
     """Compute interference pattern from phase evolution."""
     phases = np.array([s.phase for s in states])
@@ -59,6 +185,70 @@ def verify_stability(states: List[PhaseState], threshold: float = 0.9) -> bool:
 
     return coherence > threshold and energy_conserved and dim_stable
 
+class StabilityMonitor:
+    """Streaming form of verify_stability in O(1) memory.
+
+    Consumes states as they are produced and keeps the running mean of
+    exp(i·Δphase) for phase coherence, plus Welford mean and variance of
+    energy and dimension. The same criteria as verify_stability are then
+    available at any time without storing the trajectory. Phases, energies
+    and dimensions may be scalars or (N,) arrays to monitor an ensemble
+    member by member.
+    """
+
+    def __init__(self, threshold: float = 0.9, min_samples: int = 2):
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.count = 0
+        self.last_phase = None
+        self.phasor_sum = 0j
+        self.energy_mean, self.energy_m2 = 0.0, 0.0
+        self.dim_mean, self.dim_m2 = 0.0, 0.0
+
+    def update(self, phase: Union[float, np.ndarray], energy: Union[float, np.ndarray],
+               dimension: Union[float, np.ndarray]) -> Union[bool, np.ndarray]:
+        """Add one state; return whether it is still considered stable."""
+        if self.last_phase is not None:
+            self.phasor_sum = self.phasor_sum + np.exp(1j * (phase - self.last_phase))
+        self.last_phase = np.copy(phase)
+        self.count += 1
+
+        # Welford updates
+        delta = energy - self.energy_mean
+        self.energy_mean = self.energy_mean + delta / self.count
+        self.energy_m2 = self.energy_m2 + delta * (energy - self.energy_mean)
+        delta = dimension - self.dim_mean
+        self.dim_mean = self.dim_mean + delta / self.count
+        self.dim_m2 = self.dim_m2 + delta * (dimension - self.dim_mean)
+
+        return self.stable if self.count >= self.min_samples else np.full(np.shape(phase), True)[()]
+
+    def update_state(self, state: PhaseState) -> bool:
+        """Add a PhaseState, computing its Hamiltonian once."""
+        return self.update(state.phase, compute_hamiltonian(state), state.dimension)
+
+    @property
+    def coherence(self) -> Union[float, np.ndarray]:
+        """Magnitude of the mean phase increment phasor."""
+        return np.abs(self.phasor_sum) / max(self.count - 1, 1)
+
+    @property
+    def energy_std(self) -> Union[float, np.ndarray]:
+        """Population standard deviation of the energies seen so far."""
+        return np.sqrt(self.energy_m2 / max(self.count, 1))
+
+    @property
+    def dimension_std(self) -> Union[float, np.ndarray]:
+        """Population standard deviation of the dimensions seen so far."""
+        return np.sqrt(self.dim_m2 / max(self.count, 1))
+
+    @property
+    def stable(self) -> Union[bool, np.ndarray]:
+        """verify_stability's criteria over every state seen so far."""
+        return ((self.coherence > self.threshold) &
+                (self.energy_std < self.threshold * self.energy_mean) &
+                (self.dimension_std < self.threshold))
+
 class BoundaryState(NamedTuple):
     """State of dimensional boundary."""
     surface_coords: np.ndarray
@@ -77,4 +267,328 @@ def evolve_boundary(boundary: BoundaryState, bulk: PhaseState, dt: float) -> Bou
     # Update boundary phase to maintain consistency with bulk
     new_phase = boundary.phase + dt * compute_hamiltonian(bulk)
 
-    return BoundaryState(new_coords, new_normal, new_phase)
\ No newline at end of file
+    return BoundaryState(new_coords, new_normal, new_phase)
+
+class BoundaryWorkspace(NamedTuple):
+    """Scratch buffers evolve_boundaries reuses across steps."""
+    step: np.ndarray   # (B, n) normal step, then coordinate gradient
+    phase: np.ndarray  # (B,) phase increments
+    norm: np.ndarray   # (B, 1, 1) normal lengths
+
+def allocate_boundary_workspace(boundaries: BoundaryState) -> BoundaryWorkspace:
+    """Preallocate scratch buffers for a batch of boundaries."""
+    b = len(boundaries.normal)
+    return BoundaryWorkspace(np.empty_like(boundaries.normal, dtype=float),
+                             np.empty(b), np.empty((b, 1, 1)))
+
+def evolve_boundaries(boundaries: BoundaryState, bulk: Union[PhaseState, EnsembleState],
+                      dt: float, out: Optional[BoundaryState] = None,
+                      workspace: Optional[BoundaryWorkspace] = None) -> BoundaryState:
+    """Advance B boundaries at once, matching evolve_boundary for each.
+
+    boundaries holds surface_coords and normal of shape (B, n) and phase of
+    shape (B,). A single bulk PhaseState drives every boundary with one
+    Hamiltonian; an EnsembleState of B members drives boundary i with member
+    i. The coordinate gradient repeats np.gradient's arithmetic along the
+    last axis, and normals are normalized per row with one batched dot
+    product, which reduces in the same order as np.linalg.norm on a single
+    vector, so every row equals evolve_boundary bit for bit.
+
+    out receives the result and may be boundaries itself to evolve in
+    place; workspace holds the intermediates. With both given, a step
+    allocates nothing beyond the bulk Hamiltonian.
+    """
+    coords, normal, phase = boundaries
+    if coords.shape[-1] < 2:
+        raise ValueError("Boundaries need at least two surface points")
+    if out is None:
+        out = BoundaryState(np.empty_like(coords), np.empty_like(normal),
+                            np.empty(np.shape(phase)))
+    if workspace is None:
+        workspace = allocate_boundary_workspace(boundaries)
+    new_coords, new_normal, new_phase = out
+    step, increment, norm = workspace
+    energy = (compute_hamiltonian(bulk) if isinstance(bulk, PhaseState)
+              else compute_hamiltonians(bulk))
+
+    # Every read of the old state happens before out is written
+    np.multiply(dt, normal, out=step)
+    np.add(coords, step, out=new_coords)
+    np.multiply(dt, energy, out=increment)
+    np.add(phase, increment, out=new_phase)
+
+    # Central differences inside, one-sided at the ends, as np.gradient
+    np.subtract(new_coords[..., 2:], new_coords[..., :-2], out=step[..., 1:-1])
+    step[..., 1:-1] /= 2
+    np.subtract(new_coords[..., 1], new_coords[..., 0], out=step[..., 0])
+    np.subtract(new_coords[..., -1], new_coords[..., -2], out=step[..., -1])
+    step *= dt
+    np.subtract(normal, step, out=new_normal)
+
+    np.matmul(new_normal[..., None, :], new_normal[..., :, None], out=norm)
+    np.sqrt(norm, out=norm)
+    new_normal /= norm[..., 0]
+    return out
+
+class CrossingEvent(NamedTuple):
+    """Time at which the dimension crossed an integer or critical point."""
+    time: float
+    dimension: float
+    kind: str  # 'integer' or a CRITICAL_POINTS name
+
+class AdaptiveResult(NamedTuple):
+    """Adaptive integration output at the solver's accepted steps."""
+    t: np.ndarray
+    states: List[PhaseState]
+    boundaries: Optional[List[BoundaryState]]
+    events: List[CrossingEvent]
+
+def phase_rates(t: float, y: np.ndarray, k: int, dt: float, m: int = 0) -> np.ndarray:
+    """Continuous-time rates of the phase_evolution/evolve_boundary system.
+
+    State vector layout is [q, p, phase, dimension] for k coordinates,
+    followed by [surface_coords, normal, boundary_phase] for m surface
+    points when a boundary is attached. The leapfrog and phase updates
+    converge to q' = p, p' = -q and phase' = H. The dimension update does
+    not have a step-independent limit: phase_evolution adds
+    dt·sin(Δphase) with Δphase = dt·H per step, so the dimension moves at
+    sin(dt·H) per unit time, which depends on the step dt of the
+    fixed-step run being followed. The boundary moves along its normal,
+    and the normal follows the negative coordinate gradient projected onto
+    the sphere of its current length, which keeps a unit normal normalized
+    without a separate normalization step.
+    """
+    q, p, dim = y[:k], y[k:2*k], y[2*k + 1]
+    H = (np.sum(p**2) / 2 + np.sum(q**2) / 2) * np.exp(-dim**2/4*np.pi)
+
+    rates = np.empty_like(y)
+    rates[:k], rates[k:2*k] = p, -q
+    rates[2*k], rates[2*k + 1] = H, np.sin(dt * H)
+    if m:
+        coords, normal = y[2*k + 2:2*k + 2 + m], y[2*k + 2 + m:2*k + 2 + 2*m]
+        pull = -np.gradient(coords) if m > 1 else np.zeros(1)
+        rates[2*k + 2:2*k + 2 + m] = normal
+        rates[2*k + 2 + m:2*k + 2 + 2*m] = pull - np.dot(pull, normal) / np.dot(normal, normal) * normal
+        rates[-1] = H
+    return rates
+
+def integrate_adaptive(state: PhaseState, t_span: Tuple[float, float], dt: float,
+                       boundary: Optional[BoundaryState] = None,
+                       rtol: float = 1e-8, atol: float = 1e-10,
+                       critical_points: Optional[Dict[str, float]] = None,
+                       method: str = 'DOP853') -> AdaptiveResult:
+    """Integrate the phase system with error-controlled step sizes.
+
+    Uses solve_ivp on phase_rates, so steps grow in quiet regions and shrink
+    where the phase turns quickly. dt is the step of the fixed-step
+    phase_evolution run this replaces; it sets the dimension's rate (see
+    phase_rates), and the result tracks that run up to its own O(dt)
+    discretization error. Events record every time the dimension crosses
+    an integer (zeros of sin(πd)) or one of the critical points; a run
+    starting exactly on one does not report it as a crossing.
+
+    The boundary normal is normalized on entry, as evolve_boundary
+    normalizes it after every step.
+    """
+    critical_points = CRITICAL_POINTS if critical_points is None else critical_points
+    k = len(state.q)
+    m = 0 if boundary is None else len(boundary.surface_coords)
+    parts = [state.q, state.p, [state.phase, state.dimension]]
+    if boundary is not None:
+        normal = np.asarray(boundary.normal, dtype=float)
+        parts += [boundary.surface_coords, normal / np.linalg.norm(normal), [boundary.phase]]
+    y0 = np.concatenate([np.asarray(v, dtype=float).ravel() for v in parts])
+
+    # Event functions receive solve_ivp's args after (t, y)
+    def crossing(value: float):
+        return lambda t, y, *args: y[2*k + 1] - value
+
+    names = ['integer'] + list(critical_points)
+    events = [lambda t, y, *args: np.sin(np.pi * y[2*k + 1])]
+    events += [crossing(value) for value in critical_points.values()]
+
+    sol = solve_ivp(phase_rates, t_span, y0, method=method, rtol=rtol, atol=atol,
+                    args=(k, dt, m), events=events)
+    if sol.status < 0:
+        raise RuntimeError(f"Adaptive integration failed: {sol.message}")
+
+    y = sol.y.T
+    states = [PhaseState(row[:k].copy(), row[k:2*k].copy(), row[2*k], row[2*k + 1]) for row in y]
+    boundaries = None
+    if boundary is not None:
+        boundaries = [BoundaryState(row[2*k + 2:2*k + 2 + m].copy(),
+                                    row[2*k + 2 + m:2*k + 2 + 2*m].copy(), row[-1]) for row in y]
+
+    # Events whose function vanishes at the start fire within the first
+    # step without the dimension having crossed anything
+    start = 1e-12 * max(1.0, abs(state.dimension))
+    on_start = [abs(event(sol.t[0], y0)) <= start for event in events]
+    first_step = sol.t[1] if len(sol.t) > 1 else sol.t[0]
+    crossings = sorted(
+        (CrossingEvent(float(t), float(ye[2*k + 1]), name)
+         for name, times, values, skip in zip(names, sol.t_events, sol.y_events, on_start)
+         for t, ye in zip(times, values) if not (skip and t <= first_step)),
+        key=lambda event: event.time)
+    return AdaptiveResult(sol.t, states, boundaries, crossings)
+
+class Checkpoint(NamedTuple):
+    """Integrator state needed to resume a run exactly."""
+    step: int
+    ensemble: EnsembleState
+    boundary: Optional[BoundaryState]
+    rng_state: Optional[dict]
+
+def _atomic_savez(path: Union[str, Path], **arrays):
+    """Write an .npz file so readers see either the old or the new file."""
+    path = Path(path)
+    tmp = path.with_name(f'.{path.stem}.{os.getpid()}.tmp.npz')
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _encode_rng_state(value):
+    """JSON hook tagging the ndarrays some bit generators keep in their state."""
+    if isinstance(value, np.ndarray):
+        return {'__ndarray__': value.tolist(), 'dtype': value.dtype.str}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _decode_rng_state(value: dict):
+    """JSON hook rebuilding ndarrays tagged by _encode_rng_state."""
+    if '__ndarray__' in value:
+        return np.array(value['__ndarray__'], dtype=value['dtype'])
+    return value
+
+def save_checkpoint(path: Union[str, Path], step: int, ensemble: EnsembleState,
+                    boundary: Optional[BoundaryState] = None,
+                    rng: Optional[np.random.Generator] = None):
+    """Atomically write bulk and boundary state, step counter and RNG state."""
+    arrays = {'step': step, 'q': ensemble.q, 'p': ensemble.p,
+              'phase': ensemble.phase, 'dimension': ensemble.dimension}
+    if boundary is not None:
+        arrays.update(surface_coords=boundary.surface_coords, normal=boundary.normal,
+                      boundary_phase=boundary.phase)
+    if rng is not None:
+        arrays['rng_state'] = json.dumps(rng.bit_generator.state, default=_encode_rng_state)
+    _atomic_savez(path, **arrays)
+
+def load_checkpoint(path: Union[str, Path]) -> Checkpoint:
+    """Read a checkpoint written by save_checkpoint."""
+    with np.load(path, allow_pickle=False) as data:
+        ensemble = EnsembleState(data['q'], data['p'], data['phase'], data['dimension'])
+        boundary = None
+        if 'surface_coords' in data:
+            boundary = BoundaryState(data['surface_coords'], data['normal'],
+                                     data['boundary_phase'][()])
+        rng_state = None
+        if 'rng_state' in data:
+            rng_state = json.loads(str(data['rng_state']), object_hook=_decode_rng_state)
+        return Checkpoint(int(data['step']), ensemble, boundary, rng_state)
+
+class TrajectoryStore:
+    """Append-only trajectory store of numbered .npz chunks in a directory.
+
+    Each chunk is written atomically, and rewriting a chunk index replaces
+    it, so a segment recomputed after a crash simply overwrites the chunk
+    it left behind.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def append(self, index: int, **arrays: np.ndarray):
+        """Write chunk number index."""
+        _atomic_savez(self.directory / f'chunk-{index:06d}.npz', **arrays)
+
+    def chunks(self) -> List[Path]:
+        """Chunk files in order."""
+        return sorted(self.directory.glob('chunk-*.npz'))
+
+    def load(self, limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Concatenate the first limit chunks (all by default) along axis 0."""
+        parts: Dict[str, List[np.ndarray]] = {}
+        for chunk in self.chunks()[:limit]:
+            with np.load(chunk, allow_pickle=False) as data:
+                for key in data.files:
+                    parts.setdefault(key, []).append(data[key])
+        return {key: np.concatenate(values) for key, values in parts.items()}
+
+def run_checkpointed(state: Union[PhaseState, EnsembleState], dt: float, steps: int,
+                     directory: Union[str, Path], boundary: Optional[BoundaryState] = None,
+                     record_every: int = 1, checkpoint_every: int = 1000,
+                     rng: Optional[np.random.Generator] = None
+                     ) -> Tuple[EnsembleState, Optional[BoundaryState]]:
+    """Run a long integration in checkpointed segments, resuming if possible.
+
+    The run advances checkpoint_every steps at a time. After each segment
+    its records are appended to a TrajectoryStore in directory and then
+    checkpoint.npz is replaced, both atomically. If directory already holds
+    a checkpoint the run resumes from it instead of from state; since the
+    saved arrays are bit-exact and the integrators deterministic, a resumed
+    run reproduces an uninterrupted one exactly. rng, if given, has its
+    state saved and restored with each checkpoint.
+
+    A boundary is evolved alongside a single trajectory with evolve_boundary,
+    driven by the bulk state at the start of each step.
+    """
+    if checkpoint_every % record_every:
+        raise ValueError("checkpoint_every must be a multiple of record_every")
+    ensemble = stack_states([state]) if isinstance(state, PhaseState) else state
+    if boundary is not None and len(ensemble.phase) != 1:
+        raise ValueError("A boundary can only follow a single trajectory")
+
+    directory = Path(directory)
+    store = TrajectoryStore(directory)
+    path = directory / 'checkpoint.npz'
+    start = 0
+    if path.exists():
+        start, ensemble, boundary, rng_state = load_checkpoint(path)
+        if rng is not None and rng_state is not None:
+            rng.bit_generator.state = rng_state
+
+    while start < steps:
+        n = min(checkpoint_every, steps - start)
+        if boundary is None:
+            ensemble, trajectory = integrate_ensemble(ensemble, dt, n, record_every)
+            chunk = trajectory._asdict()
+        else:
+            ensemble, boundary, chunk = _advance_with_boundary(ensemble, boundary, dt, n,
+                                                               record_every)
+
+        # The first record repeats the previous segment's last one
+        first = 0 if start == 0 else 1
+        chunk = {key: value[first:] for key, value in chunk.items()}
+        chunk['step'] = chunk['step'] + start
+        store.append(start // checkpoint_every, **chunk)
+
+        start += n
+        save_checkpoint(path, start, ensemble, boundary, rng)
+
+    return ensemble, boundary
+
+def _advance_with_boundary(ensemble: EnsembleState, boundary: BoundaryState, dt: float,
+                           steps: int, record_every: int
+                           ) -> Tuple[EnsembleState, BoundaryState, Dict[str, np.ndarray]]:
+    """Step one trajectory and its boundary, recording both."""
+    state = unstack_states(ensemble)[0]
+    records = []
+    for step in range(steps + 1):
+        if step % record_every == 0:
+            records.append((step, state, boundary))
+        if step < steps:
+            boundary = evolve_boundary(boundary, state, dt)
+            state = phase_evolution(state, dt)
+
+    chunk = {
+        'step': np.array([r[0] for r in records]),
+        'q': np.array([r[1].q for r in records])[:, None],
+        'p': np.array([r[1].p for r in records])[:, None],
+        'phase': np.array([r[1].phase for r in records])[:, None],
+        'dimension': np.array([r[1].dimension for r in records])[:, None],
+        'surface_coords': np.array([r[2].surface_coords for r in records]),
+        'normal': np.array([r[2].normal for r in records]),
+        'boundary_phase': np.array([r[2].phase for r in records])
+    }
+    return stack_states([state]), boundary, chunk
@@ -1,9 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from datetime import datetime
+import sys
+from pathlib import Path
 from scipy.integrate import trapezoid
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from nballs.render import RenderCache
+
 class PhaseSpaceAnalyzer:
     """Analyzer for dimensional evolution through phase organization."""
 
@@ -44,7 +48,17 @@ class PhaseSpaceAnalyzer:
         return np.mean(np.abs(waves))
 
     def create_visualization(self):
-        """Generate comprehensive phase space visualization."""
+        """Generate comprehensive phase space visualization.
+
+        Reuses the previous render while n_points and this script are unchanged.
+        """
+        return RenderCache().render(
+            'phase-space-v3-{key}.png', self._draw_visualization,
+            kind=type(self).__qualname__, params={'n_points': self.n_points, 'dpi': 300},
+            sources=[__file__])
+
+    def _draw_visualization(self, path):
+        """Draw the visualization into path."""
         fig = plt.figure(figsize=(20, 20))
 
         # Plot A: Center-Boundary Phase Organization
@@ -120,13 +134,9 @@ class PhaseSpaceAnalyzer:
         plt.tight_layout(rect=[0, 0, 1, 0.95])
 
         # Save visualization
-        now = datetime.now().strftime('%Y_%m_%d-%I_%M_%S_%p')
-        name = f'phase-space-v3-{now}.png'
-        plt.savefig(name, dpi=300, bbox_inches='tight')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
 
-        return name
-
     def analyze_dimension(self, d):
         """Detailed analysis of a specific dimension."""
         phases = np.linspace(0, self.tau, self.n_points)
@@ -1,7 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from datetime import datetime
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from nballs.render import RenderCache
 
 class DimensionalWaveAnalyzer:
     def __init__(self, n_points=401):
@@ -59,7 +63,17 @@ class DimensionalWaveAnalyzer:
         return np.abs(mean_wave) * weight * 1e-3
 
     def create_visualization(self):
-        """Generate enhanced phase space visualization."""
+        """Generate enhanced phase space visualization.
+
+        Reuses the previous render while n_points and this script are unchanged.
+        """
+        return RenderCache().render(
+            'phase-space-v6-{key}.png', self._draw_visualization,
+            kind=type(self).__qualname__, params={'n_points': self.n_points, 'dpi': 300},
+            sources=[__file__])
+
+    def _draw_visualization(self, path):
+        """Draw the visualization into path."""
         fig = plt.figure(figsize=(20, 20))
 
         # Plot A: Wave Components
@@ -138,13 +152,9 @@ class DimensionalWaveAnalyzer:
 
         plt.tight_layout(rect=[0, 0, 1, 0.95])
 
-        now = datetime.now().strftime('%Y_%m_%d-%I_%M_%S_%p')
-        name = f'phase-space-v6-{now}.png'
-        plt.savefig(name, dpi=300, bbox_inches='tight')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
 
-        return name
-
     def analyze_wave_structure(self, d):
         """Analyze wave structure at specific dimension."""
         phases = np.linspace(0, 1, self.n_points)
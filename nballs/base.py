@@ -6,10 +6,16 @@ handles common operations like signal enhancement, view management, and dimensio
 markers.
 """
 
+from __future__ import annotations
+
 import numpy as np
-import matplotlib.pyplot as plt
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only needed for annotations; figures and axes are created by callers,
+    # so importing the numeric layer never loads a plotting backend.
+    import matplotlib.pyplot as plt
 
 @dataclass
 class VisualConfig:
@@ -19,6 +25,21 @@ class VisualConfig:
     title: str
     dimension_axis: str = 'z'  # Which axis represents dimension
 
+@dataclass
+class SurfaceGeometry:
+    """Surface polygons and shaded face colors built once for several views.
+
+    Attributes:
+        verts: Quad corners of shape (faces, 4, 3) in plot (x, y, z) order
+        facecolors: Shaded RGBA color of each face
+        limits: (xlim, ylim, zlim) for the axes showing the surface
+        labels: (xlabel, ylabel, zlabel) for those axes
+    """
+    verts: np.ndarray
+    facecolors: np.ndarray
+    limits: Tuple[Tuple[float, float], ...]
+    labels: Tuple[str, ...]
+
 class VisualHelper:
     """Core visualization utilities for dimensional analysis."""
 
@@ -38,9 +59,38 @@ class VisualHelper:
         continuity and preventing saturation.
         """
         if normalize:
-            x = (x - np.nanmin(x)) / (np.nanmax(x) - np.nanmin(x) + self.epsilon)
+            lo, hi = np.nanmin(x), np.nanmax(x)
+            x = (x - lo) / (hi - lo + self.epsilon)
         return np.tanh(sharpness * x) / np.tanh(sharpness)
 
+    def _enhance_outer(self, a: np.ndarray, b: np.ndarray, out: np.ndarray,
+                       sharpness: float = 1.5, rows: int = 64) -> np.ndarray:
+        """Write 2·enhance_signal(outer(a, b)) - 1 into out without temporaries.
+
+        The extremes of an outer product are products of the factors'
+        extremes, so the normalization bounds come from the 1D factors.
+        The array is then filled in blocks of rows that stay cache-resident
+        while the whole enhancement runs over them in place.
+        """
+        a_lo, a_hi = np.nanmin(a), np.nanmax(a)
+        b_lo, b_hi = np.nanmin(b), np.nanmax(b)
+        corners = np.array([a_lo * b_lo, a_lo * b_hi, a_hi * b_lo, a_hi * b_hi])
+        lo, hi = corners.min(), corners.max()
+        scale = hi - lo + self.epsilon
+        norm = np.tanh(sharpness)
+
+        for i in range(0, len(a), rows):
+            block = out[i:i + rows]
+            np.multiply.outer(a[i:i + rows], b, out=block)
+            block -= lo
+            block /= scale
+            block *= sharpness
+            np.tanh(block, out=block)
+            block /= norm
+            block *= 2
+            block -= 1
+        return out
+
     def create_dimension_markers(self, ax: plt.Axes, scale: float = 1.0,
                                color: str = 'red', alpha: float = 0.5):
         """Add dimensional transition markers at critical points."""
@@ -53,19 +103,16 @@ class VisualHelper:
             ax.text(value_pi, scale, 0, f'{name}\n(τ{value_pi-2:.2f}π)',
                    color=color, alpha=alpha, ha='center', va='bottom')
 
-    def setup_wave_plot(self, fig: plt.Figure, idx: int, view: VisualConfig,
-                       D: np.ndarray, forward: np.ndarray, backward: np.ndarray,
-                       colors: np.ndarray,
-                       label='Wave') -> plt.Axes:
-        """Configure a single wave visualization subplot."""
-        ax = fig.add_subplot(2, 2, idx, projection='3d', proj_type='ortho')
-
-        # Handle different dimension axis configurations
+    def _view_axes(self, dimension_axis: str, D: np.ndarray, forward: np.ndarray,
+                   backward: np.ndarray, label: str) -> Tuple[Tuple[np.ndarray, ...],
+                                                              Tuple[Tuple[float, float], ...],
+                                                              Tuple[str, ...]]:
+        """Arrange surface arrays, limits and labels for a dimension axis."""
         x, y, z = forward, backward, D/np.pi
         xlim, xlabel = (-1, 1), f'Forward {label} (π units)'
         ylim, ylabel = (-1, 1), f'Backward {label} (π units)'
         zlim, zlabel = (0, 4), f'Dimensional {label} (π units)'
-        match view.dimension_axis:
+        match dimension_axis:
             case 'x':
                 x, y, z = D/np.pi, forward, backward
                 xlabel, zlabel = zlabel, xlabel
@@ -74,14 +121,113 @@ class VisualHelper:
                 x, y, z = forward, D/np.pi, backward
                 ylabel, zlabel = zlabel, ylabel
                 ylim, zlim = zlim, ylim
-        ax.set_xlim(*xlim)
-        ax.set_ylim(*ylim)
-        ax.set_zlim(*zlim)
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel(ylabel)
-        ax.set_zlabel(zlabel)
+        return (x, y, z), (xlim, ylim, zlim), (xlabel, ylabel, zlabel)
+
+    def surface_geometry(self, D: np.ndarray, forward: np.ndarray, backward: np.ndarray,
+                         colors: np.ndarray, dimension_axis: str = 'z',
+                         label: str = 'Wave', lod: int = 50) -> SurfaceGeometry:
+        """Build the polygons and shaded colors plot_surface would draw.
+
+        Samples the mesh the way plot_surface does for a count of lod faces
+        per side: rows and columns every ⌈n/lod⌉ points plus the last one,
+        each face taking the color of its first corner. Faces are shaded
+        with plot_surface's default light source, so the result looks the
+        same as plot_surface but can be added to any number of axes without
+        recomputing it.
+
+        Args:
+            D: Dimension mesh
+            forward: Forward component mesh
+            backward: Backward component mesh
+            colors: RGBA colors per mesh point
+            dimension_axis: Plot axis carrying the dimension
+            label: Quantity named in the axis labels
+            lod: Maximum faces per side (level of detail)
+
+        Returns:
+            SurfaceGeometry ready for setup_wave_plot
+        """
+        from matplotlib.colors import LightSource
+
+        (x, y, z), limits, labels = self._view_axes(dimension_axis, D, forward, backward, label)
+        rows, cols = np.shape(z)
+        rstride = int(max(np.ceil(rows / lod), 1))
+        cstride = int(max(np.ceil(cols / lod), 1))
+        r = np.r_[np.arange(0, rows - 1, rstride), rows - 1]
+        c = np.r_[np.arange(0, cols - 1, cstride), cols - 1]
+
+        mesh = np.stack([np.asarray(a, dtype=float) for a in (x, y, z)], axis=-1)
+
+        # Corners in plot_surface's perimeter order: (r0,c0) (r0,c1) (r1,c1) (r1,c0)
+        grid = mesh[np.ix_(r, c)]
+        verts = np.stack([grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]],
+                         axis=2).reshape(-1, 4, 3)
+        face = np.asarray(colors)[np.ix_(r[:-1], c[:-1])].reshape(len(verts), -1)
+
+        # plot_surface takes normals from perimeter points 0, n/3 and 2n/3 of each patch
+        r0, c0 = (a.ravel() for a in np.meshgrid(r[:-1], c[:-1], indexing='ij'))
+        h, w = (a.ravel() for a in np.meshgrid(np.diff(r), np.diff(c), indexing='ij'))
+        n = 2 * (h + w)
+        p0, p1, p2 = (mesh[self._perimeter_point(r0, c0, h, w, k)] for k in (0, n//3, 2*n//3))
+        normals = np.cross(p0 - p1, p1 - p2)
+
+        finite = np.isfinite(verts).all(axis=(1, 2))
+        verts, face, normals = verts[finite], face[finite], normals[finite]
+
+        # Lambert shading as in mplot3d: brightness spans [0.3, 1] over the normal·light range
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shade = (normals / np.linalg.norm(normals, axis=1, keepdims=True)
+                     ) @ LightSource(azdeg=225, altdeg=19.4712).direction
+        shaded = face.astype(float)
+        if not np.isnan(shade).all():
+            shaded[:, :3] *= (0.65 + 0.35 * np.nan_to_num(shade))[:, np.newaxis]
+
+        return SurfaceGeometry(verts, shaded, limits, labels)
+
+    def _perimeter_point(self, r0: np.ndarray, c0: np.ndarray, h: np.ndarray,
+                         w: np.ndarray, k: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Mesh index of the k-th point walking each patch's perimeter.
+
+        The walk follows matplotlib's perimeter order: along the first row,
+        down the last column, back along the last row, up the first column.
+        """
+        return (np.select([k < w, k < w + h, k < 2*w + h],
+                          [r0, r0 + k - w, r0 + h], r0 + h - (k - 2*w - h)),
+                np.select([k < w, k < w + h, k < 2*w + h],
+                          [c0 + k, c0 + w, c0 + w - (k - w - h)], c0))
+
+    def setup_wave_plot(self, fig: plt.Figure, idx: int, view: VisualConfig,
+                       D: np.ndarray, forward: np.ndarray, backward: np.ndarray,
+                       colors: np.ndarray,
+                       label='Wave',
+                       geometry: Optional[SurfaceGeometry] = None) -> plt.Axes:
+        """Configure a single wave visualization subplot.
+
+        When geometry is given (see surface_geometry) its prebuilt polygons
+        are drawn instead of running plot_surface on the mesh again.
+        """
+        ax = fig.add_subplot(2, 2, idx, projection='3d', proj_type='ortho')
+
+        # Handle different dimension axis configurations
+        if geometry is None:
+            (x, y, z), limits, labels = self._view_axes(view.dimension_axis, D,
+                                                        forward, backward, label)
+        else:
+            limits, labels = geometry.limits, geometry.labels
+        ax.set_xlim(*limits[0])
+        ax.set_ylim(*limits[1])
+        ax.set_zlim(*limits[2])
+        ax.set_xlabel(labels[0])
+        ax.set_ylabel(labels[1])
+        ax.set_zlabel(labels[2])
         ax.set_box_aspect([1, 1, 1])
-        ax.plot_surface(x, y, z, facecolors=colors, alpha=0.9)
+        if geometry is None:
+            ax.plot_surface(x, y, z, facecolors=colors, alpha=0.9)
+        else:
+            from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+            ax.add_collection3d(Poly3DCollection(
+                geometry.verts, facecolors=geometry.facecolors,
+                edgecolors=geometry.facecolors, alpha=0.9))
         ax.view_init(elev=view.elev, azim=view.azim)
         ax.set_title(f'Geometric {label}: {view.title}')
 
@@ -91,6 +237,39 @@ class VisualHelper:
 
         return ax
 
+    def render_wave_views(self, fig: plt.Figure, D: np.ndarray, forward: np.ndarray,
+                          backward: np.ndarray, colors: np.ndarray, label: str = 'Wave',
+                          lod: int = 50,
+                          views: Optional[Sequence[VisualConfig]] = None) -> List[plt.Axes]:
+        """Draw one surface from several perspectives, building it once.
+
+        Geometry and shading depend only on which axis carries the
+        dimension, so views sharing a dimension axis share one
+        SurfaceGeometry.
+
+        Args:
+            fig: Figure receiving a 2x2 grid of views
+            D: Dimension mesh
+            forward: Forward component mesh
+            backward: Backward component mesh
+            colors: RGBA colors per mesh point
+            label: Quantity named in titles and axis labels
+            lod: Maximum faces per side (level of detail)
+            views: Perspectives to draw (standard_views by default)
+
+        Returns:
+            List of the created axes
+        """
+        geometries = {}
+        axes = []
+        for idx, view in enumerate(views if views is not None else self.standard_views, 1):
+            if view.dimension_axis not in geometries:
+                geometries[view.dimension_axis] = self.surface_geometry(
+                    D, forward, backward, colors, view.dimension_axis, label, lod)
+            axes.append(self.setup_wave_plot(fig, idx, view, D, forward, backward, colors,
+                                             label, geometries[view.dimension_axis]))
+        return axes
+
     def add_coherence_subplot(self, fig: plt.Figure, dims: np.ndarray,
                             coherence: np.ndarray):
         """Add small coherence reference subplot."""
@@ -106,19 +285,45 @@ class VisualHelper:
             ax_coh.axvline(value/np.pi, color='red', alpha=0.3, linestyle='--')
 
     def prepare_wave_data(self, dims: np.ndarray, phases: np.ndarray,
-                         wave_components: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
-        """Prepare wave data for visualization with consistent normalization."""
-        forward = np.outer(wave_components['forward_amp'], np.cos(phases))
-        backward = np.outer(wave_components['backward_amp'], np.sin(phases))
+                         wave_components: Dict[str, np.ndarray],
+                         dtype: np.dtype = np.float64,
+                         out: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """Prepare wave data for visualization with consistent normalization.
+
+        Forward and backward surfaces are built straight into their output
+        arrays from the 1D amplitude and phase factors, and color_metric is
+        a read-only broadcast view of its per-dimension column, so peak
+        memory is the two surfaces themselves.
+
+        Args:
+            dims: Dimensions sampled
+            phases: Phase angles sampled
+            wave_components: 1D forward_amp, backward_amp, coherence and
+                phase_diff arrays over dims
+            dtype: Floating type of the returned surfaces (float32 halves
+                their memory)
+            out: Optional preallocated 'forward' and 'backward' arrays of
+                shape (len(dims), len(phases)), reused across calls
+
+        Returns:
+            Dictionary of forward, backward and color_metric arrays
+        """
+        shape = (len(wave_components['forward_amp']), len(phases))
+        out = out if out is not None else {}
+        forward = out.get('forward')
+        backward = out.get('backward')
+        forward = forward if forward is not None else np.empty(shape, dtype=dtype)
+        backward = backward if backward is not None else np.empty(shape, dtype=dtype)
 
         # Enhance signals
-        forward = 2 * self.enhance_signal(forward) - 1
-        backward = 2 * self.enhance_signal(backward) - 1
+        self._enhance_outer(wave_components['forward_amp'], np.cos(phases), forward)
+        self._enhance_outer(wave_components['backward_amp'], np.sin(phases), backward)
 
         # Create color metric from coherence and phase
-        color_metric = (self.enhance_signal(wave_components['coherence'])[:, np.newaxis] *
-                       np.abs(np.cos(wave_components['phase_diff']))[:, np.newaxis])
-        color_metric = np.tile(color_metric, (1, len(phases)))
+        color_metric = (self.enhance_signal(wave_components['coherence']) *
+                        np.abs(np.cos(wave_components['phase_diff'])))
+        color_metric = np.broadcast_to(color_metric.astype(dtype, copy=False)[:, np.newaxis],
+                                       shape)
 
         return {
             'forward': forward,
@@ -15,12 +15,34 @@ Key concepts:
 __package__ = 'nballs'
 
 import numpy as np
+from collections import OrderedDict
 from numpy import pi, e
-from scipy.special import gamma
-from dataclasses import dataclass
-from typing import Tuple, Optional, Union, Dict
+from scipy.special import gamma, gammaln, digamma, polygamma
+from dataclasses import dataclass, fields
+from typing import Tuple, Optional, Union, Dict, Callable, Any, Sequence
 from .base import VisualHelper
 
+# Scalar dimension or array of dimensions
+ArrayLike = Union[float, np.ndarray]
+
+def shaped_like(values: np.ndarray, d: ArrayLike) -> ArrayLike:
+    """Reshape a flat result to the shape of d, unwrapping scalars."""
+    if isinstance(d, (int, float)):
+        return values.reshape(())[()] if isinstance(values, np.ndarray) else values
+    return np.reshape(values, np.shape(d))[()]
+
+def linspace_chunk(start: float, stop: float, num: int, i0: int, i1: int) -> np.ndarray:
+    """Return entries i0:i1 of np.linspace(start, stop, num) without building it.
+
+    Reproduces linspace's arithmetic (i·step + start, with the last entry
+    pinned to stop), so concatenated chunks equal the full grid exactly.
+    """
+    step = (stop - start) / (num - 1) if num > 1 else 0.0
+    dims = np.arange(i0, i1) * step + start
+    if i1 == num > 1 and i1 > i0:
+        dims[-1] = stop
+    return dims
+
 @dataclass
 class GeometricState:
     """Container for fundamental geometric measurements across dimensions.
@@ -44,6 +66,197 @@ class GeometricState:
     coupling: float
     phase: float
 
+@dataclass
+class GeometricStateBatch:
+    """Columnar container of geometric measurements across many dimensions.
+
+    Holds one contiguous array per GeometricState field. Integer indexing
+    returns the GeometricState at that position, while slices and index
+    arrays return a narrower batch.
+
+    Attributes:
+        dimension: Dimensions being analyzed
+        volume: N-ball volumes
+        surface: Surface areas
+        next_surface: Surface areas of n+1 balls
+        radius: Characteristic radii for unit volume
+        freedom: Geometric freedom/rotational capacity
+        coupling: Surface-volume coupling coefficients
+        phase: Phase angles of geometric states
+    """
+    dimension: np.ndarray
+    volume: np.ndarray
+    surface: np.ndarray
+    next_surface: np.ndarray
+    radius: np.ndarray
+    freedom: np.ndarray
+    coupling: np.ndarray
+    phase: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dimension)
+
+    def __getitem__(self, index) -> Union[GeometricState, 'GeometricStateBatch']:
+        values = {f.name: getattr(self, f.name)[index] for f in fields(self)}
+        if np.ndim(values['dimension']) == 0:
+            return GeometricState(**values)
+        return GeometricStateBatch(**values)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class DimensionStencil:
+    """Shifted views of one batch evaluation over a dimension grid.
+
+    Many measurements combine the state at d with its neighbours at d±1.
+    On a uniform grid whose spacing divides 1, those neighbours are
+    themselves grid entries, so the stencil evaluates once on the grid
+    extended by ``reach`` unit steps at each end and serves every shift
+    k (|k| ≤ reach) as a slice of that single result. Other grids fall
+    back to evaluating dims + k directly, once per requested shift.
+
+    Attributes:
+        dims: Grid the shifted views are aligned with
+        reach: Largest unit shift served by slicing
+        evaluations: Number of dimensions evaluated so far
+    """
+
+    def __init__(self, dims: np.ndarray, evaluate: Callable[[np.ndarray], Any],
+                 reach: int = 1, atol: float = 1e-9,
+                 evaluate_shifts: Optional[Callable[[np.ndarray, Sequence[int]],
+                                                    Dict[int, Any]]] = None):
+        """Evaluate the extended grid when the spacing allows it.
+
+        Args:
+            dims: Grid of dimensions
+            evaluate: Vectorized evaluation returning a sliceable batch
+            reach: Largest unit shift to serve
+            atol: Tolerance for matching shifted grid entries to dims + k
+            evaluate_shifts: Optional evaluation of several shifts of dims
+                at once, used instead of evaluate when slicing is unavailable
+        """
+        self.dims = np.atleast_1d(np.asarray(dims, dtype=float))
+        self.evaluate = evaluate
+        self.evaluate_shifts = evaluate_shifts
+        self.reach = reach
+        self.evaluations = 0
+        self._views = {}
+        self._offsets = {}
+
+        n = len(self.dims)
+        h = (self.dims[-1] - self.dims[0]) / (n - 1) if n > 1 else 0.0
+        m = int(round(1 / h)) if h > 0 else 0
+
+        # Extend only when it costs fewer evaluations than direct shifts
+        if 0 < m < n and abs(m * h - 1) < atol:
+            pad = reach * m
+            extended = np.concatenate([
+                self.dims[0] + h * np.arange(-pad, 0),
+                self.dims,
+                self.dims[-1] + h * np.arange(1, pad + 1)
+            ])
+            self._extended = self._evaluate(extended)
+            for k in range(-reach, reach + 1):
+                lo = pad + k * m
+                if np.allclose(extended[lo:lo + n], self.dims + k, rtol=0, atol=atol):
+                    self._offsets[k] = lo
+
+    def _evaluate(self, dims: np.ndarray) -> Any:
+        self.evaluations += len(dims)
+        return self.evaluate(dims)
+
+    def shift(self, k: int) -> Any:
+        """Return the evaluation at dims + k."""
+        if k in self._offsets:
+            lo = self._offsets[k]
+            return self._extended[lo:lo + len(self.dims)]
+        if k not in self._views:
+            if self.evaluate_shifts is None:
+                self._views[k] = self._evaluate(self.dims + k)
+            else:
+                missing = [j for j in range(-self.reach, self.reach + 1)
+                           if j not in self._offsets and j not in self._views]
+                if k not in missing:
+                    missing.append(k)
+                self.evaluations += len(self.dims) * len(missing)
+                self._views.update(self.evaluate_shifts(self.dims, missing))
+        return self._views[k]
+
+    def __getitem__(self, k: int) -> Any:
+        return self.shift(k)
+
+@dataclass
+class CacheStats:
+    """Counters describing an EvaluationCache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that required a fresh evaluation
+        evictions: Entries dropped to respect the capacity
+        size: Entries currently held
+        capacity: Maximum number of entries
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    capacity: int
+
+class EvaluationCache:
+    """Bounded memo of scalar geometric evaluations.
+
+    Entries are evicted once capacity is reached, either least recently
+    used ('lru') or in insertion order ('fifo').
+    """
+
+    policies = ('lru', 'fifo')
+
+    def __init__(self, capacity: int = 4096, eviction: str = 'lru'):
+        """Create an empty cache.
+
+        Args:
+            capacity: Maximum number of entries held
+            eviction: Eviction policy, 'lru' or 'fifo'
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if eviction not in self.policies:
+            raise ValueError(f"eviction must be one of {self.policies}, got {eviction!r}")
+        self.capacity = capacity
+        self.eviction = eviction
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.eviction == 'lru':
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Tuple, value: Any):
+        """Store value under key, evicting as needed."""
+        self._entries[key] = value
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        return CacheStats(self.hits, self.misses, self.evictions,
+                          len(self._entries), self.capacity)
+
 class NBallCore(VisualHelper):
     """Core analysis framework for n-ball dimensional evolution.
 
@@ -69,91 +282,225 @@ class NBallCore(VisualHelper):
         self.pi = np.pi
         self.tau = 2 * np.pi
         self.epsilon = epsilon
+        self.cache: Optional[EvaluationCache] = None
         self.critical_points = {
             'volume_max': 5.256946,  # ~τ-1 region
             'freedom_max': 6.118750,  # ~τ region
             'surface_max': 7.256946   # ~τ+1 region
         }
 
-    def ball_volume(self, d: float) -> float:
+    def enable_cache(self, capacity: int = 4096, eviction: str = 'lru') -> EvaluationCache:
+        """Memoize scalar analyze_dimension calls in a bounded cache.
+
+        Entries are keyed on the dimension, epsilon and evaluation mode, so
+        changing epsilon never serves stale states. Cached GeometricStates
+        are shared between callers and should be treated as read-only.
+
+        Every scalar path reads through the cache: phase_velocity,
+        dimensional_coupling, interference_pattern, compute_coupling_state,
+        compute_wave_state and analyze_transitions. Array inputs are
+        evaluated in one vectorized pass and bypass it.
+
+        Args:
+            capacity: Maximum number of cached states
+            eviction: Eviction policy, 'lru' or 'fifo'
+
+        Returns:
+            The new cache
+        """
+        self.cache = EvaluationCache(capacity, eviction)
+        return self.cache
+
+    def disable_cache(self):
+        """Stop memoizing and release cached states."""
+        self.cache = None
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Return hit/miss/eviction counters, or None when caching is off."""
+        return self.cache.stats() if self.cache is not None else None
+
+    def ball_volume(self, d: ArrayLike) -> ArrayLike:
         """Calculate n-ball volume using gamma function relationship.
 
         The volume follows V(d) = π^(d/2) / Γ(d/2 + 1), revealing deep
         connections to wave-like behavior through the gamma function.
 
         Args:
-            d: Dimension (can be non-integer)
+            d: Dimension (can be non-integer) or array of dimensions
 
         Returns:
-            Volume of n-ball in dimension d
+            Volume of n-ball in dimension d, shaped like d (zero once
+            Γ(d/2 + 1) overflows, near d ≈ 342)
         """
-        if d < 0:
-            return 0
-        try:
-            return (pi ** (d/2)) / gamma(d/2 + 1)
-        except:
-            return 0
-
-    def ball_surface(self, d: float) -> float:
+        if isinstance(d, (int, float)):
+            g = gamma(d/2 + 1)
+            if d < 0 or g == np.inf:
+                return 0.0
+            return (pi ** (d/2)) / g
+
+        d = np.asarray(d, dtype=float)
+        g = gamma(d/2 + 1)
+        with np.errstate(over='ignore', invalid='ignore'):
+            v = (pi ** (d/2)) / g
+        return np.where((d < 0) | np.isinf(g), 0.0, v)[()]
+
+    def ball_surface(self, d: ArrayLike) -> ArrayLike:
         """Calculate n-ball surface area through dimensional relationship.
 
         The surface area follows S(d) = τ·π^((d-2)/2) / Γ(d/2), maintaining
-        the fundamental coupling S(d+1) = τ·V(d).
+        the fundamental coupling S(d+2) = τ·V(d).
 
         Args:
-            d: Dimension (can be non-integer)
+            d: Dimension (can be non-integer) or array of dimensions
 
         Returns:
-            Surface area in dimension d
+            Surface area in dimension d, shaped like d (zero once Γ(d/2)
+            overflows)
         """
-        if d < 0:
-            return 0
-        try:
-            return self.tau * (pi ** ((d-2)/2)) / gamma(d/2)
-        except:
-            return 0
-
-    def ball_radius(self, d: float, volume: float = 1.0) -> float:
+        if isinstance(d, (int, float)):
+            g = gamma(d/2)
+            if d < 0 or g == np.inf:
+                return 0.0
+            return self.tau * (pi ** ((d-2)/2)) / g
+
+        d = np.asarray(d, dtype=float)
+        g = gamma(d/2)
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            s = self.tau * (pi ** ((d-2)/2)) / g
+        return np.where((d < 0) | np.isinf(g), 0.0, s)[()]
+
+    def ball_radius(self, d: ArrayLike, volume: float = 1.0) -> ArrayLike:
         """Calculate characteristic radius for given volume.
 
         The radius acts as an information carrier between dimensions,
         revealing how geometric constraints propagate through phase space.
 
         Args:
-            d: Dimension
+            d: Dimension or array of dimensions
             volume: Target volume (default 1.0)
 
         Returns:
-            Radius needed to achieve target volume in dimension d
+            Radius needed to achieve target volume in dimension d, shaped like d
+            (taken from log_ball_radius where the gamma ratio overflows)
+        """
+        if isinstance(d, (int, float)):
+            if d <= 0:
+                return 0.0
+            g = gamma(d/2 + 1)
+            if g == np.inf:
+                return np.exp(self.log_ball_radius(d, volume))
+            return (volume * g / (pi ** (d/2))) ** (1/d)
+
+        d = np.asarray(d, dtype=float)
+        g = gamma(d/2 + 1)
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            r = (volume * g / (pi ** (d/2))) ** (1/d)
+            overflow = np.isinf(g)
+            if overflow.any():
+                r = np.where(overflow, np.exp(self.log_ball_radius(d, volume)), r)
+        return np.where(d <= 0, 0.0, r)[()]
+
+    def log_ball_volume(self, d: ArrayLike) -> ArrayLike:
+        """Calculate natural log of n-ball volume through log-gamma.
+
+        Evaluates log V(d) = (d/2)·log π - log Γ(d/2 + 1) without forming
+        either factor, so it stays finite far beyond d ≈ 340 where the
+        direct ratio overflows.
+
+        Args:
+            d: Dimension (can be non-integer) or array of dimensions
+
+        Returns:
+            log V(d), shaped like d (-inf where the volume vanishes)
         """
-        if d <= 0:
-            return 0
-        try:
-            return (volume * gamma(d/2 + 1) / (pi ** (d/2))) ** (1/d)
-        except:
-            return 0
-
-    def geometric_freedom(self, d: float) -> float:
+        d = np.asarray(d, dtype=float)
+        with np.errstate(invalid='ignore'):
+            lv = (d/2) * np.log(pi) - gammaln(d/2 + 1)
+        return np.where(d < 0, -np.inf, lv)[()]
+
+    def log_ball_surface(self, d: ArrayLike) -> ArrayLike:
+        """Calculate natural log of n-ball surface area through log-gamma.
+
+        Evaluates log S(d) = log τ + ((d-2)/2)·log π - log Γ(d/2).
+
+        Args:
+            d: Dimension (can be non-integer) or array of dimensions
+
+        Returns:
+            log S(d), shaped like d (-inf where the surface vanishes)
+        """
+        d = np.asarray(d, dtype=float)
+        with np.errstate(invalid='ignore'):
+            ls = np.log(self.tau) + ((d-2)/2) * np.log(pi) - gammaln(d/2)
+        return np.where(d < 0, -np.inf, ls)[()]
+
+    def log_ball_radius(self, d: ArrayLike, volume: float = 1.0) -> ArrayLike:
+        """Calculate natural log of characteristic radius for given volume.
+
+        Uses log r = (log volume - log V(d)) / d, which remains accurate
+        where Γ(d/2 + 1) and π^(d/2) both overflow.
+
+        Args:
+            d: Dimension or array of dimensions
+            volume: Target volume (default 1.0)
+
+        Returns:
+            log r(d), shaped like d (-inf where the radius vanishes)
+        """
+        d = np.asarray(d, dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            lr = (np.log(volume) - self.log_ball_volume(d)) / d
+        return np.where(d <= 0, -np.inf, lr)[()]
+
+    def _log_arctan2(self, log_y: ArrayLike, log_x: ArrayLike) -> ArrayLike:
+        """Evaluate arctan2(y, x) for positive y, x given as logarithms."""
+        log_y, log_x = np.asarray(log_y), np.asarray(log_x)
+        m = np.maximum(log_y, log_x)
+        m = np.where(np.isfinite(m), m, 0.0)
+        return np.arctan2(np.exp(log_y - m), np.exp(log_x - m))[()]
+
+    def geometric_freedom(self, d: ArrayLike, log_domain: bool = False) -> ArrayLike:
         """Calculate rotational freedom/geometric capacity.
 
         This measures the available rotational choices and geometric
         constraints at each dimension, peaking near τ.
 
         Args:
-            d: Dimension
+            d: Dimension or array of dimensions
+            log_domain: Evaluate from log-volume and log-surface, which keeps
+                the result exact (rather than cut to zero by epsilon) once
+                the volume underflows at high dimension
 
         Returns:
-            Geometric freedom measure
+            Geometric freedom measure, shaped like d
         """
-        v = self.ball_volume(d)
-        s = self.ball_surface(d)
-        if abs(v) < self.epsilon:
-            return 0
+        if log_domain:
+            d = np.asarray(d, dtype=float)
+            return self._log_freedom(d, self.log_ball_volume(d), self.log_ball_surface(d))
+        return self._freedom(d, self.ball_volume(d), self.ball_surface(d))
+
+    def _freedom(self, d: np.ndarray, v: ArrayLike, s: ArrayLike) -> ArrayLike:
+        """Geometric freedom from precomputed volume and surface."""
+        if isinstance(v, float):
+            if abs(v) < self.epsilon:
+                return 0.0
+            theta = np.arctan2(s, self.tau * v)
+            r = (s**2 + (self.tau * v)**2)**0.5
+            return r * abs(np.sin(theta * d))
+
         theta = np.arctan2(s, self.tau * v)
         r = (s**2 + (self.tau * v)**2)**0.5
-        return r * abs(np.sin(theta * d))
+        return np.where(abs(v) < self.epsilon, 0.0, r * abs(np.sin(theta * d)))[()]
 
-    def analyze_dimension(self, d: float) -> GeometricState:
+    def _log_freedom(self, d: np.ndarray, lv: ArrayLike, ls: ArrayLike) -> ArrayLike:
+        """Geometric freedom from precomputed log-volume and log-surface."""
+        ltv = np.log(self.tau) + lv
+        theta = self._log_arctan2(ls, ltv)
+        r = np.exp(np.logaddexp(2*ls, 2*ltv) / 2)
+        return (r * abs(np.sin(theta * d)))[()]
+
+    def analyze_dimension(self, d: float, log_domain: bool = False,
+                          recurrence: bool = False) -> GeometricState:
         """Perform comprehensive geometric analysis at dimension d.
 
         Computes fundamental measurements and relationships that characterize
@@ -161,10 +508,31 @@ class NBallCore(VisualHelper):
 
         Args:
             d: Dimension to analyze
+            log_domain: Derive every measurement from log-gamma quantities.
+                Volume and surface then underflow gracefully to zero while
+                coupling, phase and radius stay exact at any dimension.
+            recurrence: Evaluate only V(d) and V(d+1) through gamma and
+                derive surfaces and radius from them (see volume_ladder)
 
         Returns:
             GeometricState containing core measurements
         """
+        if self.cache is None or np.ndim(d) != 0:
+            return self._analyze_dimension(d, log_domain, recurrence)
+
+        key = (float(d), self.epsilon, log_domain, recurrence)
+        state = self.cache.get(key)
+        if state is None:
+            state = self._analyze_dimension(d, log_domain, recurrence)
+            self.cache.put(key, state)
+        return state
+
+    def _analyze_dimension(self, d: float, log_domain: bool,
+                           recurrence: bool) -> GeometricState:
+        """Uncached body of analyze_dimension."""
+        if log_domain or recurrence:
+            return GeometricState(**self._geometry(d, log_domain, recurrence))
+
         v = self.ball_volume(d)
         s = self.ball_surface(d)
         s_next = self.ball_surface(d + 1)
@@ -188,6 +556,197 @@ class NBallCore(VisualHelper):
             phase=p
         )
 
+    def analyze_dimensions(self, dims: np.ndarray, log_domain: bool = False,
+                           recurrence: bool = False) -> GeometricStateBatch:
+        """Perform geometric analysis over an array of dimensions at once.
+
+        Vectorized counterpart of analyze_dimension that stores each
+        measurement as one contiguous array instead of building a
+        GeometricState per dimension.
+
+        Args:
+            dims: Dimensions to analyze
+            log_domain: Derive every measurement from log-gamma quantities
+            recurrence: Evaluate two gammas per dimension instead of four
+
+        Returns:
+            GeometricStateBatch with one entry per dimension
+        """
+        d = np.atleast_1d(np.asarray(dims, dtype=float))
+        return GeometricStateBatch(**self._geometry(d, log_domain, recurrence))
+
+    def analyze_shifts(self, dims: np.ndarray, shifts: Sequence[int] = (-1, 0, 1),
+                       log_domain: bool = False) -> Dict[int, GeometricStateBatch]:
+        """Analyze the family of states at dims + k for integer shifts k.
+
+        All shifts share one volume_ladder, so the whole family costs two
+        gamma evaluations per dimension regardless of how many shifts are
+        requested.
+
+        Args:
+            dims: Base dimensions
+            shifts: Integer offsets to analyze
+            log_domain: Work from log-volumes throughout
+
+        Returns:
+            Dictionary mapping each shift to its GeometricStateBatch
+        """
+        d = np.atleast_1d(np.asarray(dims, dtype=float))
+        rungs = sorted(set(shifts) | {k + 1 for k in shifts})
+        ladder = dict(zip(rungs, self.volume_ladder(d, rungs, log_domain)))
+        return {
+            k: GeometricStateBatch(**self._geometry_from_volumes(
+                d + k, ladder[k], ladder[k + 1], log_domain))
+            for k in shifts
+        }
+
+    def integer_table(self, n_max: int, log_domain: bool = False) -> GeometricStateBatch:
+        """Tabulate geometric states at integer dimensions 0, 1, ..., n_max.
+
+        Starts from V(0) = 1 and V(1) = 2 and climbs the volume ladder, so
+        the table needs no gamma evaluations beyond those two.
+
+        Args:
+            n_max: Highest dimension in the table
+            log_domain: Work from log-volumes throughout
+
+        Returns:
+            GeometricStateBatch indexed by integer dimension
+        """
+        ladder = self.volume_ladder(0.0, range(n_max + 2), log_domain)
+        return GeometricStateBatch(**self._geometry_from_volumes(
+            np.arange(n_max + 1, dtype=float), ladder[:-1], ladder[1:], log_domain))
+
+    def volume_ladder(self, d: ArrayLike, shifts: Sequence[int] = range(-2, 3),
+                      log_domain: bool = False) -> np.ndarray:
+        """Evaluate volumes at d + k for integer shifts k by gamma recurrence.
+
+        Only V(d) and V(d+1) go through (log-)gamma. Every other shift
+        follows from V(x+2) = τ/(x+2)·V(x), stepping two dimensions up or
+        down at a time. Each step is one multiply and one divide, so with
+        unit roundoff u = 2⁻⁵³ the result satisfies
+
+            |V_ladder(d+k) / V(d+k) - 1| ≤ ε_Γ + 4u·⌈|k|/2⌉
+
+        relative to exact values, where ε_Γ is the relative error of the two
+        base evaluations (a few tens of u for d up to ~50). The direct
+        formula carries an error of the same order at every point, so the
+        two agree to within 2ε_Γ + 4u·⌈|k|/2⌉. In log_domain the same bound
+        applies as an absolute error on log V. Shifts landing below
+        dimension zero give zero volume (-inf in log_domain), as in
+        ball_volume.
+
+        Args:
+            d: Base dimension or array of base dimensions
+            shifts: Integer offsets to evaluate
+            log_domain: Return log-volumes
+
+        Returns:
+            Array of shape (len(shifts),) + shape of d
+        """
+        shape = np.shape(d)
+        d = np.atleast_1d(np.asarray(d, dtype=float))
+        shifts = [int(k) for k in shifts]
+        base = self.log_ball_volume if log_domain else self.ball_volume
+        parities = {k % 2 for k in shifts}
+        rungs = {p: base(d + p) for p in parities}
+        log_tau = np.log(self.tau)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for k in range(2, max(shifts) + 1):
+                if k % 2 in parities:
+                    x = d + k
+                    rungs[k] = (rungs[k-2] + log_tau - np.log(x) if log_domain
+                                else rungs[k-2] * self.tau / x)
+            for k in range(-1, min(shifts) - 1, -1):
+                if k % 2 in parities:
+                    x = d + k + 2
+                    rungs[k] = (rungs[k+2] + np.log(x) - log_tau if log_domain
+                                else rungs[k+2] * x / self.tau)
+
+        ladder = np.stack([np.broadcast_to(rungs[k], d.shape) for k in shifts])
+
+        # Negative bases were clamped to zero volume, so climb from them directly
+        negative = d < 0
+        if negative.any():
+            for i, k in enumerate(shifts):
+                ladder[i][negative] = base(d[negative] + k)
+
+        targets = d + np.reshape(shifts, (-1,) + (1,) * d.ndim)
+        ladder = np.where(targets < 0, -np.inf if log_domain else 0.0, ladder)
+        return ladder.reshape((len(shifts),) + shape)
+
+    def _geometry(self, d: ArrayLike, log_domain: bool = False,
+                  recurrence: bool = False) -> Dict[str, ArrayLike]:
+        """Geometric measurements keyed by GeometricState field."""
+        d = np.asarray(d, dtype=float)
+        if recurrence:
+            base = self.log_ball_volume if log_domain else self.ball_volume
+            return self._geometry_from_volumes(d, base(d), base(d + 1), log_domain)
+        if log_domain:
+            return self._log_fields(d, self.log_ball_volume(d),
+                                    self.log_ball_surface(d),
+                                    self.log_ball_surface(d + 1))
+        return self._fields(d, self.ball_volume(d), self.ball_surface(d),
+                            self.ball_surface(d + 1), self.ball_radius(d))
+
+    def _geometry_from_volumes(self, d: np.ndarray, v: ArrayLike, v_next: ArrayLike,
+                               log_domain: bool = False) -> Dict[str, ArrayLike]:
+        """Geometric measurements from V(d) and V(d+1) alone.
+
+        Uses S(d) = d·V(d), which follows from Γ(d/2 + 1) = (d/2)·Γ(d/2),
+        and r = V(d)^(-1/d) for unit volume.
+        """
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if log_domain:
+                ls = np.where(d <= 0, -np.inf, np.log(d) + v)
+                ls_next = np.where(d + 1 <= 0, -np.inf, np.log(d + 1) + v_next)
+                return self._log_fields(d, v, ls, ls_next)
+            r = np.where(d <= 0, 0.0, v ** (-1/d))
+        return self._fields(d, v, d * v, (d + 1) * v_next, r)
+
+    def _fields(self, d: np.ndarray, v: ArrayLike, s: ArrayLike,
+                s_next: ArrayLike, r: ArrayLike) -> Dict[str, ArrayLike]:
+        """Complete a GeometricState field mapping from its measurements."""
+        tv = self.tau * v
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = np.where(abs(v) > self.epsilon, s_next / tv, 0.0)
+
+        return {
+            'dimension': d[()],
+            'volume': np.asarray(v)[()],
+            'surface': np.asarray(s)[()],
+            'next_surface': np.asarray(s_next)[()],
+            'radius': np.asarray(r)[()],
+            'freedom': self._freedom(d, v, s),
+            'coupling': c[()],
+            'phase': np.arctan2(s_next, tv)[()]
+        }
+
+    def _log_fields(self, d: np.ndarray, lv: ArrayLike, ls: ArrayLike,
+                    ls_next: ArrayLike) -> Dict[str, ArrayLike]:
+        """Complete a GeometricState field mapping from log-measurements.
+
+        Coupling and phase come from the ratio log S(d+1) - log τV(d), so
+        they are never lost to overflow or to the epsilon guard.
+        """
+        ltv = np.log(self.tau) + lv
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = np.where(np.isneginf(lv), 0.0, np.exp(ls_next - ltv))
+            lr = np.where(d <= 0, -np.inf, -lv / d)
+
+        return {
+            'dimension': d[()],
+            'volume': np.exp(lv)[()],
+            'surface': np.exp(ls)[()],
+            'next_surface': np.exp(ls_next)[()],
+            'radius': np.exp(lr)[()],
+            'freedom': self._log_freedom(d, lv, ls),
+            'coupling': c[()],
+            'phase': self._log_arctan2(ls_next, ltv)
+        }
+
     def safe_gradient(self, values: np.ndarray, dims: np.ndarray) -> np.ndarray:
         """Compute numerically stable gradient.
 
@@ -205,19 +764,26 @@ class NBallCore(VisualHelper):
         dy = np.gradient(values)
         return np.divide(dy, dx, where=abs(dx) > self.epsilon)
 
-    def phase_velocity(self, d: float, delta: float = 0.001) -> Tuple[float, float]:
+    def phase_velocity(self, d: ArrayLike, delta: float = 0.001,
+                       analytic: bool = False) -> Tuple[ArrayLike, ArrayLike]:
         """Compute phase space velocity and acceleration.
 
         Tracks how geometric states evolve through phase space, revealing
         wave-like behavior and resonance.
 
         Args:
-            d: Dimension
+            d: Dimension (or array of dimensions when analytic)
             delta: Small step for numerical derivatives
+            analytic: Use the exact digamma/polygamma derivatives from
+                geometric_derivatives instead of finite differences
 
         Returns:
             Tuple of (velocity, acceleration)
         """
+        if analytic:
+            derivs = self.geometric_derivatives(d)
+            return derivs['phase_velocity'], derivs['phase_acceleration']
+
         # Compute phase angles at d±delta
         p_minus = self.analyze_dimension(d - delta).phase
         p_center = self.analyze_dimension(d).phase
@@ -229,30 +795,154 @@ class NBallCore(VisualHelper):
 
         return velocity, accel
 
-    def dimensional_coupling(self, d: float) -> Dict[str, float]:
+    def geometric_derivatives(self, d: ArrayLike,
+                              log_domain: bool = False) -> Dict[str, ArrayLike]:
+        """Compute exact first and second derivatives of phase, coupling and freedom.
+
+        For d ≥ 0 the coupling is c = S(d+1)/τV(d), whose logarithm
+        log Γ(d/2 + 1) - log Γ((d+1)/2) - ½·log π differentiates into digamma
+        and trigamma terms, and the phase is arctan(c). Freedom reduces to
+        V(d)·√(d² + τ²)·|sin(d·arctan(d/τ))| because S(d) = d·V(d). No
+        finite differences are taken, so there is no step-size cancellation.
+
+        Below dimension zero the measurements are constant and their
+        derivatives vanish. Where the epsilon guard zeroes coupling or
+        freedom, so are their derivatives, unless log_domain is set.
+
+        Args:
+            d: Dimension or array of dimensions
+            log_domain: Match the log-domain values, which carry no epsilon guard
+
+        Returns:
+            Dictionary with phase, coupling and freedom values plus their
+            *_velocity and *_acceleration derivatives, each shaped like d
+        """
+        dims = np.atleast_1d(np.asarray(d, dtype=float))
+        state = self.analyze_dimensions(dims, log_domain=log_domain)
+        x = np.maximum(dims, 0.0)
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            # Coupling through its log-derivatives
+            c = np.exp(gammaln(x/2 + 1) - gammaln((x + 1)/2) - np.log(pi)/2)
+            dl = (digamma(x/2 + 1) - digamma((x + 1)/2)) / 2
+            d2l = (polygamma(1, x/2 + 1) - polygamma(1, (x + 1)/2)) / 4
+            dc = c * dl
+            d2c = c * (d2l + dl**2)
+
+            # Phase = arctan(c)
+            w = 1 + c**2
+            dp = dc / w
+            d2p = (d2c * w - 2 * c * dc**2) / w**2
+
+            # Freedom = |V·g·sin h| with g = √(d² + τ²), h = d·arctan(d/τ)
+            lv = self.log_ball_volume(x)
+            dlv = (np.log(pi) - digamma(x/2 + 1)) / 2
+            d2lv = -polygamma(1, x/2 + 1) / 4
+            g2 = x**2 + self.tau**2
+            g = np.sqrt(g2)
+            dg = x / g
+            d2g = self.tau**2 / g**3
+            h = x * np.arctan(x / self.tau)
+            dh = np.arctan(x / self.tau) + x * self.tau / g2
+            d2h = 2 * self.tau**3 / g2**2
+
+            q = g * np.sin(h)
+            dq = dg * np.sin(h) + g * np.cos(h) * dh
+            d2q = (d2g * np.sin(h) + 2 * dg * np.cos(h) * dh +
+                   g * (np.cos(h) * d2h - np.sin(h) * dh**2))
+            sign = np.sign(q) * np.exp(lv)
+            df = sign * (dlv * q + dq)
+            d2f = sign * ((d2lv + dlv**2) * q + 2 * dlv * dq + d2q)
+
+        # Constant below zero, and zero wherever the guard applies
+        flat = dims < 0
+        coupling_off = flat | (state.coupling == 0)
+        freedom_off = flat | ((state.freedom == 0) & (not log_domain))
+
+        derivs = {
+            'phase': state.phase,
+            'phase_velocity': np.where(flat, 0.0, dp),
+            'phase_acceleration': np.where(flat, 0.0, d2p),
+            'coupling': state.coupling,
+            'coupling_velocity': np.where(coupling_off, 0.0, dc),
+            'coupling_acceleration': np.where(coupling_off, 0.0, d2c),
+            'freedom': state.freedom,
+            'freedom_velocity': np.where(freedom_off, 0.0, df),
+            'freedom_acceleration': np.where(freedom_off, 0.0, d2f)
+        }
+        return {k: shaped_like(v, d) for k, v in derivs.items()}
+
+    def stencil(self, dims: np.ndarray, reach: int = 1, log_domain: bool = False,
+                recurrence: bool = False) -> DimensionStencil:
+        """Build a stencil of geometric states at dims + k for |k| ≤ reach.
+
+        Args:
+            dims: Grid of dimensions
+            reach: Largest unit shift needed
+            log_domain: Derive states from log-gamma quantities
+            recurrence: Use the volume ladder, so that grids which cannot be
+                sliced still cost two gamma evaluations per dimension
+
+        Returns:
+            DimensionStencil serving GeometricStateBatch views
+        """
+        return DimensionStencil(
+            dims,
+            lambda x: self.analyze_dimensions(x, log_domain, recurrence),
+            reach,
+            evaluate_shifts=(
+                (lambda x, ks: self.analyze_shifts(x, ks, log_domain))
+                if recurrence else None))
+
+    def dimensional_coupling(self, d: ArrayLike) -> Dict[str, ArrayLike]:
         """Analyze coupling between adjacent dimensions.
 
         Examines how geometric information propagates through dimensional
         transitions via surface-volume relationships.
 
         Args:
-            d: Dimension
+            d: Dimension or array of dimensions
 
         Returns:
-            Dictionary of coupling metrics
+            Dictionary of coupling metrics, each shaped like d
         """
+        if isinstance(d, (int, float)):
+            return self._point_coupling(d)
+
+        st = self.stencil(d)
+        state, next_state = st[0], st[1]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Volume propagation
+            v_coupling = np.where(abs(state.volume) > self.epsilon,
+                                  next_state.volume / state.volume, 0)
+
+            # Surface propagation
+            s_coupling = np.where(abs(state.surface) > self.epsilon,
+                                  next_state.surface / state.surface, 0)
+
+            # Radius evolution
+            r_coupling = np.where(abs(state.radius) > self.epsilon,
+                                  next_state.radius / state.radius, 0)
+
+        return {
+            'volume_coupling': shaped_like(v_coupling, d),
+            'surface_coupling': shaped_like(s_coupling, d),
+            'radius_coupling': shaped_like(r_coupling, d),
+            'freedom_ratio': shaped_like(
+                next_state.freedom / (state.freedom + self.epsilon), d),
+            'phase_advance': shaped_like(next_state.phase - state.phase, d)
+        }
+
+    def _point_coupling(self, d: float) -> Dict[str, float]:
+        """Scalar dimensional_coupling through (cached) analyze_dimension."""
         state = self.analyze_dimension(d)
         next_state = self.analyze_dimension(d + 1)
 
-        # Volume propagation
         v_coupling = (next_state.volume / state.volume
                      if abs(state.volume) > self.epsilon else 0)
-
-        # Surface propagation
         s_coupling = (next_state.surface / state.surface
                      if abs(state.surface) > self.epsilon else 0)
-
-        # Radius evolution
         r_coupling = (next_state.radius / state.radius
                      if abs(state.radius) > self.epsilon else 0)
 
@@ -264,29 +954,35 @@ class NBallCore(VisualHelper):
             'phase_advance': next_state.phase - state.phase
         }
 
-    def interference_pattern(self, d: float) -> Tuple[float, float, float, float]:
+    def interference_pattern(self, d: ArrayLike) -> Tuple[ArrayLike, ArrayLike,
+                                                          ArrayLike, ArrayLike]:
         """Analyze bidirectional phase interference between dimensions.
 
         Examines how forward and backward phase evolution creates
         interference patterns that shape geometric transitions.
 
         Args:
-            d: Dimension
+            d: Dimension or array of dimensions
 
         Returns:
             Tuple of (magnitude, phase, real_component, imag_component)
         """
         # Forward and backward transitions
-        state = self.analyze_dimension(d)
-        next_state = self.analyze_dimension(d + 1)
-        prev_state = self.analyze_dimension(d - 1)
+        if isinstance(d, (int, float)):
+            next_state = self.analyze_dimension(d + 1)
+            prev_state = self.analyze_dimension(d - 1)
+            dims = d
+        else:
+            st = self.stencil(d)
+            next_state, prev_state = st[1], st[-1]
+            dims = st.dims
 
         # Phase rotation relative to τ-1
-        theta = (d - (self.tau - 1)) / 2 * pi / 2
+        theta = (dims - (self.tau - 1)) / 2 * pi / 2
 
         # Compute interference between transitions
         interference = (np.sin(next_state.phase) * np.cos(prev_state.phase) *
-                       np.exp(-((d - self.tau)**2)/(2*pi)))
+                       np.exp(-((dims - self.tau)**2)/(2*pi)))
 
         # Extract components
         real_part = interference * np.cos(theta)
@@ -295,28 +991,111 @@ class NBallCore(VisualHelper):
         magnitude = (real_part**2 + imag_part**2)**0.5
         phase = np.arctan2(imag_part, real_part)
 
-        return magnitude, phase, real_part, imag_part
+        return tuple(shaped_like(x, d) for x in (magnitude, phase, real_part, imag_part))
+
+    def adaptive_sample(self, evaluate: Callable[[np.ndarray], Dict[str, np.ndarray]],
+                        d1: float, d2: float, keys: Sequence[str],
+                        tol: float = 1e-3, initial_points: int = 17,
+                        max_points: int = 4096, min_width: float = 1e-6,
+                        seeds: Sequence[float] = ()) -> Dict[str, np.ndarray]:
+        """Sample a vectorized evaluation on a grid refined around sharp features.
 
-    def void_ratio(self, d: float) -> float:
+        Starts from a uniform grid plus any seed dimensions (such as the
+        critical points) and repeatedly bisects intervals. Each pass
+        evaluates the midpoints of all flagged intervals at once and
+        compares them with linear interpolation between the endpoints; where
+        the deviation of any key, relative to that key's range, exceeds tol,
+        both halves stay flagged. Flat regions therefore stop refining early
+        while curved ones keep being resolved.
+
+        Args:
+            evaluate: Maps an array of dimensions to a dictionary of arrays
+            d1: Starting dimension
+            d2: Ending dimension
+            keys: Entries of the evaluation that drive refinement
+            tol: Relative interpolation error tolerated per interval
+            initial_points: Size of the starting uniform grid
+            max_points: Evaluation budget, including the starting grid
+            min_width: Intervals narrower than this are not split
+            seeds: Extra dimensions included in the starting grid
+
+        Returns:
+            Dictionary with sorted 'dimensions' and every evaluated entry
+        """
+        seeds = np.asarray(seeds, dtype=float)
+        x = np.unique(np.concatenate([
+            np.linspace(d1, d2, initial_points),
+            seeds[(seeds > min(d1, d2)) & (seeds < max(d1, d2))]
+        ]))
+        values = {k: np.asarray(v) for k, v in evaluate(x).items() if k != 'dimensions'}
+        flagged = np.ones(len(x) - 1, dtype=bool)
+
+        while flagged.any() and len(x) < max_points:
+            width = np.diff(x)
+            candidates = np.flatnonzero(flagged & (width > 2 * min_width))
+            if len(candidates) == 0:
+                break
+            # Spend a short budget on the widest intervals first
+            candidates = candidates[np.argsort(-width[candidates], kind='stable')]
+            candidates = np.sort(candidates[:max_points - len(x)])
+
+            mid = (x[candidates] + x[candidates + 1]) / 2
+            mid_values = {k: np.asarray(v) for k, v in evaluate(mid).items()
+                          if k != 'dimensions'}
+
+            error = np.zeros(len(mid))
+            for k in keys:
+                v = values[k]
+                scale = np.ptp(v) if np.all(np.isfinite(v)) else 0.0
+                linear = (v[candidates] + v[candidates + 1]) / 2
+                error = np.maximum(error, abs(mid_values[k] - linear) / (scale or 1.0))
+            split = error > tol
+
+            # Merge midpoints in; halves of split intervals stay flagged
+            order = np.argsort(np.concatenate([x, mid]), kind='stable')
+            flags = np.zeros(len(x) + len(mid), dtype=bool)
+            flags[candidates] = split
+            flags[len(x):] = split
+            x = np.concatenate([x, mid])[order]
+            values = {k: np.concatenate([v, mid_values[k]])[order] for k, v in values.items()}
+            flagged = flags[order][:-1]
+
+        return {'dimensions': x, **values}
+
+    def void_ratio(self, d: ArrayLike, log_domain: bool = False,
+                   geometry: Optional[GeometricStateBatch] = None) -> ArrayLike:
         """Calculate geometric inefficiency through void space ratio.
 
         Measures how much of the enclosing space is not utilized by
         the n-ball, revealing dimensional efficiency patterns.
 
         Args:
-            d: Dimension
+            d: Dimension or array of dimensions
+            log_domain: Form v/r^d as exp(log v - d·log r), avoiding the
+                overflow of r^d at high dimension
+            geometry: Precomputed geometric states at d whose volume and
+                radius are reused (ignored when log_domain)
 
         Returns:
             Void ratio (0 = perfect efficiency, 1 = complete void)
         """
-        v = self.ball_volume(d)
-        r = self.ball_radius(d)
-
-        if d <= 0 or r <= 0:
-            return 1.0
-
-        enclosing = r**d
-        return 1 - min(1.0, max(0.0, v/enclosing))
+        d = np.asarray(d, dtype=float)
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            if log_domain:
+                ratio = np.exp(np.minimum(
+                    self.log_ball_volume(d) - d * self.log_ball_radius(d), 0.0))
+                degenerate = d <= 0
+            else:
+                if geometry is not None:
+                    v, r = geometry.volume, geometry.radius
+                else:
+                    v = self.ball_volume(d)
+                    r = self.ball_radius(d)
+                ratio = np.nan_to_num(v / r**d, nan=0.0)
+                degenerate = (d <= 0) | (r <= 0)
+
+        void = 1 - np.clip(ratio, 0.0, 1.0)
+        return np.where(degenerate, 1.0, void)[()]
 
     def __str__(self) -> str:
         """Return string representation with key information."""
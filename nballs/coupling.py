@@ -13,11 +13,9 @@ resonance patterns near critical points like τ±1.
 __package__ = 'nballs'
 
 import numpy as np
-from datetime import datetime
-import matplotlib.pyplot as plt
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, List
-from .core import NBallCore, GeometricState
+from typing import Dict, Tuple, Optional, List, Iterator, Any
+from .core import NBallCore, GeometricState, DimensionStencil, ArrayLike, linspace_chunk
 
 @dataclass
 class CouplingState:
@@ -40,6 +38,68 @@ class CouplingState:
     resonance: float
     coherence: float
 
+class FlowReducer:
+    """Running summary of a streamed coupling flow.
+
+    Tracks the extrema of flow and the local maxima of resonance as chunks
+    arrive. Only the last two resonance samples are carried between chunks,
+    so peaks straddling a chunk boundary are still found.
+
+    Attributes:
+        count: Number of points consumed
+        flow_min: Smallest flow value seen
+        flow_max: Largest flow value seen
+        flow_argmin: Dimension of the first smallest flow value
+        flow_argmax: Dimension of the first largest flow value
+        resonance_peaks: Dimensions of resonance local maxima
+        resonance_peak_values: Resonance at each peak
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.flow_min = np.inf
+        self.flow_max = -np.inf
+        self.flow_argmin = np.nan
+        self.flow_argmax = np.nan
+        self.resonance_peaks: List[float] = []
+        self.resonance_peak_values: List[float] = []
+        self._tail_dims = np.empty(0)
+        self._tail_resonance = np.empty(0)
+
+    def update(self, chunk: Dict[str, np.ndarray]):
+        """Fold one coupling flow chunk into the summary."""
+        dims, flow = chunk['dimensions'], chunk['flow']
+        if len(dims) == 0:
+            return
+        self.count += len(dims)
+
+        i = np.argmin(flow)
+        if flow[i] < self.flow_min:
+            self.flow_min, self.flow_argmin = float(flow[i]), float(dims[i])
+        i = np.argmax(flow)
+        if flow[i] > self.flow_max:
+            self.flow_max, self.flow_argmax = float(flow[i]), float(dims[i])
+
+        # Peaks are rising on the left and not rising on the right
+        d = np.concatenate([self._tail_dims, dims])
+        r = np.concatenate([self._tail_resonance, chunk['resonance']])
+        peaks = np.flatnonzero((r[1:-1] > r[:-2]) & (r[1:-1] >= r[2:])) + 1
+        self.resonance_peaks.extend(d[peaks].tolist())
+        self.resonance_peak_values.extend(r[peaks].tolist())
+        self._tail_dims, self._tail_resonance = d[-2:], r[-2:]
+
+    def result(self) -> Dict[str, Any]:
+        """Return the summary as a dictionary."""
+        return {
+            'points': self.count,
+            'flow_min': self.flow_min,
+            'flow_max': self.flow_max,
+            'flow_argmin': self.flow_argmin,
+            'flow_argmax': self.flow_argmax,
+            'resonance_peaks': np.array(self.resonance_peaks),
+            'resonance_peak_values': np.array(self.resonance_peak_values)
+        }
+
 class DimensionalCouplingAnalyzer(NBallCore):
     """Analyzer for geometric coupling between dimensions.
 
@@ -91,24 +151,143 @@ class DimensionalCouplingAnalyzer(NBallCore):
             coherence=coherence
         )
 
+    def compute_coupling_states(self, dims: np.ndarray, recurrence: bool = False,
+                                stencil: Optional[DimensionStencil] = None) -> Dict[str, np.ndarray]:
+        """Compute coupling configuration over an array of dimensions.
+
+        Array counterpart of compute_coupling_state. The d-1, d and d+1
+        geometric states come from one stencil evaluation, so neighbouring
+        grid points share their states instead of recomputing them.
+
+        Args:
+            dims: Dimensions to analyze
+            recurrence: Evaluate the stencil through the volume ladder
+            stencil: Precomputed geometric stencil over the clamped dims,
+                shared with other analyses
+
+        Returns:
+            Dictionary of arrays keyed by CouplingState field
+        """
+        d = np.maximum(self.epsilon, np.atleast_1d(np.asarray(dims, dtype=float)))
+        st = stencil if stencil is not None else self.stencil(d, recurrence=recurrence)
+        prev_state, curr_state, next_state = st[-1], st[0], st[1]
+
+        return {
+            'dimension': d,
+            'forward_coupling': next_state.volume / (curr_state.surface + self.epsilon),
+            'backward_coupling': curr_state.volume / (prev_state.surface + self.epsilon),
+            'radius_transfer': np.log1p(next_state.radius/(curr_state.radius + self.epsilon)),
+            'phase_advance': next_state.phase - curr_state.phase,
+            'resonance': np.exp(-((d*np.pi - self.nearest_critical(d))**2)/(2*self.tau)),
+            'coherence': np.cos(curr_state.phase - prev_state.phase)
+        }
+
+    def nearest_critical(self, d: ArrayLike) -> ArrayLike:
+        """Return the critical point nearest to each π-scaled dimension.
+
+        Args:
+            d: Dimension or array of dimensions (in π units)
+
+        Returns:
+            Critical point values, shaped like d
+        """
+        points = np.fromiter(self.critical_points.values(), dtype=float)
+        d = np.asarray(d, dtype=float)
+        idx = np.argmin(abs(points/np.pi - d[..., np.newaxis]), axis=-1)
+        return points[idx][()]
+
     def coupling_flow(self, d1: float, d2: float, points: int = 401) -> Dict[str, np.ndarray]:
         """Analyze coupling flow between dimensions with π-normalized phases."""
         dims = np.linspace(d1, d2, points)
-
-        # Collect coupling states
-        states = [self.compute_coupling_state(d) for d in dims]
-
-        # Extract and normalize components in π units
-        f_coupling = np.array([s.forward_coupling for s in states])
-        b_coupling = np.array([s.backward_coupling for s in states])
-        r_transfer = np.array([s.radius_transfer for s in states])
-        phase = np.array([s.phase_advance for s in states])
-        coherence = np.array([s.coherence for s in states])
-        resonance = np.array([s.resonance for s in states])
+        return self.flow_from_states(dims, self.compute_coupling_states(dims))
+
+    def iter_coupling_flow(self, d1: float, d2: float, points: int = 401,
+                           chunk_size: int = 65536,
+                           recurrence: bool = False) -> Iterator[Dict[str, np.ndarray]]:
+        """Stream coupling flow over a dimension range in fixed-size chunks.
+
+        Yields the coupling_flow dictionary for consecutive slices of
+        np.linspace(d1, d2, points); concatenating the chunks reproduces
+        coupling_flow(d1, d2, points). Each chunk evaluates its own d±1
+        neighbours, so chunk edges need no state from adjacent chunks and
+        memory stays proportional to chunk_size.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            points: Total number of sampling points
+            chunk_size: Maximum number of points per chunk
+            recurrence: Evaluate through the volume ladder, which keeps the
+                cost at two gammas per point on grids too fine to slice
+
+        Yields:
+            Coupling flow dictionaries of at most chunk_size points
+        """
+        for i0 in range(0, points, chunk_size):
+            dims = linspace_chunk(d1, d2, points, i0, min(i0 + chunk_size, points))
+            yield self.flow_from_states(dims, self.compute_coupling_states(dims, recurrence))
+
+    def coupling_flow_summary(self, d1: float, d2: float, points: int = 401,
+                              chunk_size: int = 65536,
+                              reducer: Optional['FlowReducer'] = None) -> 'FlowReducer':
+        """Summarize coupling flow without materializing the full series.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            points: Total number of sampling points
+            chunk_size: Maximum number of points per chunk
+            reducer: Reducer to feed (a fresh FlowReducer by default)
+
+        Returns:
+            The reducer after consuming every chunk
+        """
+        reducer = reducer if reducer is not None else FlowReducer()
+        for chunk in self.iter_coupling_flow(d1, d2, points, chunk_size):
+            reducer.update(chunk)
+        return reducer
+
+    def adaptive_coupling_flow(self, d1: float, d2: float, tol: float = 1e-3,
+                               keys: Tuple[str, ...] = ('flow', 'coherence'),
+                               max_points: int = 4096, **kwargs) -> Dict[str, np.ndarray]:
+        """Analyze coupling flow on an adaptively refined dimension grid.
+
+        Seeds the grid with the critical points (in π units, as used by the
+        resonance term) and refines where the selected flow components curve
+        sharply; see NBallCore.adaptive_sample.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            tol: Relative interpolation error tolerated per interval
+            keys: Flow components that drive refinement
+            max_points: Evaluation budget
+            **kwargs: Further options for adaptive_sample
+
+        Returns:
+            Coupling flow dictionary over the non-uniform grid
+        """
+        seeds = np.fromiter(self.critical_points.values(), dtype=float) / np.pi
+        return self.adaptive_sample(
+            lambda dims: self.flow_from_states(dims, self.compute_coupling_states(dims)),
+            d1, d2, keys, tol=tol, max_points=max_points, seeds=seeds, **kwargs)
+
+    def flow_from_states(self, dims: np.ndarray,
+                         states: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Normalize coupling state arrays into the coupling flow dictionary.
+
+        Args:
+            dims: Dimensions the states were computed at
+            states: Output of compute_coupling_states
+
+        Returns:
+            Coupling flow dictionary, as coupling_flow
+        """
+        coherence = states['coherence']
 
         # Normalize to ±π range
-        f_norm = np.clip(f_coupling/np.pi, -1, 1)  # Now in π units
-        b_norm = np.clip(b_coupling/np.pi, -1, 1)  # Now in π units
+        f_norm = np.clip(states['forward_coupling']/np.pi, -1, 1)  # Now in π units
+        b_norm = np.clip(states['backward_coupling']/np.pi, -1, 1)  # Now in π units
 
         # Combined flow strength preserves π scaling
         flow = np.sqrt(f_norm**2 + b_norm**2) * coherence
@@ -117,61 +296,74 @@ class DimensionalCouplingAnalyzer(NBallCore):
             'dimensions': dims,
             'forward_coupling': f_norm,
             'backward_coupling': b_norm,
-            'radius_transfer': r_transfer,
-            'phase': phase,
+            'radius_transfer': states['radius_transfer'],
+            'phase': states['phase_advance'],
             'coherence': coherence,
             'flow': flow,
-            'resonance': resonance
+            'resonance': states['resonance']
         }
 
 if __name__ == '__main__':
     """Create multi-perspective visualization of dimensional coupling flow."""
+    import matplotlib.pyplot as plt
+    from .render import RenderCache, package_sources
+
     # Create analyzer
     analyzer = DimensionalCouplingAnalyzer()
 
-    # High resolution sampling
+    # High resolution sampling, drawn with at most lod faces per side
     n_points = 401
-    dims = np.linspace(0, 4*np.pi, n_points)
-    phases = np.linspace(0, 2*np.pi, n_points)
-
-    # Compute coupling with π normalization
-    flow = analyzer.coupling_flow(0, 4, points=n_points)
-
-    # Create meshgrid
-    D, P = np.meshgrid(dims, phases)
-
-    # Extract π-normalized components
-    forward = np.abs(flow['forward_coupling'])
-    backward = np.abs(flow['backward_coupling'])
-    resonance = (flow['resonance'] - flow['resonance'].min()) / \
-                (flow['resonance'].max() - flow['resonance'].min())
-
-    # Create phase space structure
-    forward = np.outer(forward, np.cos(phases)).reshape(n_points, n_points)
-    backward = np.outer(backward, np.sin(phases)).reshape(n_points, n_points)
-    resonance = np.tile(resonance, (n_points, 1))
-
-    # Create figure with 2x2 grid
-    fig = plt.figure(figsize=(20, 20))
-
-    # Create subplots
-    norm = plt.Normalize(-1, 1)
-    for idx, view in enumerate(analyzer.standard_views, 1):
-        ax = analyzer.setup_wave_plot(
-            fig, idx, view, D,
-            forward, backward,
-            plt.cm.RdYlBu_r(norm(2*resonance - 1)),
-            label='Coupling Flow',
+    lod = 50
+    dpi = 300
+    cmap = plt.cm.RdYlBu_r
+
+    def draw(path: str):
+        """Compute the figure data and render it to path."""
+        dims = np.linspace(0, 4*np.pi, n_points)
+        phases = np.linspace(0, 2*np.pi, n_points)
+
+        # Compute coupling with π normalization
+        flow = analyzer.coupling_flow(0, 4, points=n_points)
+
+        # Create meshgrid
+        D, P = np.meshgrid(dims, phases)
+
+        # Extract π-normalized components
+        forward = np.abs(flow['forward_coupling'])
+        backward = np.abs(flow['backward_coupling'])
+        resonance = (flow['resonance'] - flow['resonance'].min()) / \
+                    (flow['resonance'].max() - flow['resonance'].min())
+
+        # Create phase space structure
+        forward = np.outer(forward, np.cos(phases)).reshape(n_points, n_points)
+        backward = np.outer(backward, np.sin(phases)).reshape(n_points, n_points)
+        resonance = np.tile(resonance, (n_points, 1))
+
+        # Create figure with 2x2 grid
+        fig = plt.figure(figsize=(20, 20))
+
+        # Create subplots sharing one surface geometry
+        norm = plt.Normalize(-1, 1)
+        analyzer.render_wave_views(
+            fig, D, forward, backward,
+            cmap(norm(2*resonance - 1)),
+            label='Coupling Flow', lod=lod
         )
 
-    # Add main title
-    fig.suptitle('Dimensional Coupling Flow Analysis\nPhase Space in π Units', fontsize=16, y=0.95)
+        # Add main title
+        fig.suptitle('Dimensional Coupling Flow Analysis\nPhase Space in π Units', fontsize=16, y=0.95)
+
+        # Adjust layout
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
 
-    # Adjust layout
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+        # Save or show
+        plt.savefig(path, dpi=dpi, bbox_inches='tight')
+        plt.close()
 
-    # Save or show
-    now = datetime.now().strftime('%Y_%m_%d-%I_%M_%S_%p')
-    name = f'nballs-{now}-{analyzer.__class__.__qualname__}.png'
-    plt.savefig(name, dpi=300, bbox_inches='tight')
-    plt.close()
+    # Reuse the previous render unless the analyzer, parameters or code changed
+    RenderCache().render(
+        f'nballs-{{key}}-{analyzer.__class__.__qualname__}.png', draw,
+        kind=analyzer.__class__.__qualname__,
+        params={'epsilon': analyzer.epsilon, 'n_points': n_points, 'lod': lod, 'dpi': dpi,
+                'views': analyzer.standard_views, 'colormap': cmap.name},
+        sources=package_sources())
@@ -0,0 +1,273 @@
+"""Process-pool sweeps over dimension ranges and analyzer parameters.
+
+The analyzers evaluate every dimension independently: coupling flow carries
+its own d±1 neighbours and wave metrics are pointwise. A sweep can
+therefore be cut into index sub-ranges of the shared linspace grid (see
+linspace_chunk), or into parameter sets such as epsilon or a replacement
+critical point table, and evaluated in separate worker processes.
+
+Workers write their slices straight into a shared memory block owned by the
+parent, so only small task descriptors cross the process boundary. Anything
+that couples neighbouring samples, like the phase velocity gradient of the
+interference analysis, is computed in the parent once the grid is complete.
+"""
+
+__package__ = 'nballs'
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Sequence, Any
+from .core import linspace_chunk
+from .coupling import DimensionalCouplingAnalyzer
+from .wave import WaveGeometryAnalyzer
+
+FLOW_KEYS = ('dimensions', 'forward_coupling', 'backward_coupling', 'radius_transfer',
+             'phase', 'coherence', 'flow', 'resonance')
+METRIC_KEYS = ('coherence', 'energy', 'stability', 'resonance', 'phase')
+
+@dataclass(frozen=True)
+class SweepTask:
+    """Descriptor for one worker's share of a sweep.
+
+    Attributes:
+        kind: 'flow' for coupling flow, 'metrics' for wave metrics
+        d1: Starting dimension of the full grid
+        d2: Ending dimension of the full grid
+        points: Number of points in the full grid
+        i0: First grid index evaluated by this task
+        i1: One past the last grid index
+        slot: Parameter set written by this task
+        epsilon: Numerical safety threshold
+        critical_points: Optional replacement critical point table
+        shm_name: Shared memory block receiving the results
+        shape: Shape of the (slots, keys, points) result array
+    """
+    kind: str
+    d1: float
+    d2: float
+    points: int
+    i0: int
+    i1: int
+    slot: int
+    epsilon: float
+    critical_points: Optional[Dict[str, float]]
+    shm_name: str
+    shape: Tuple[int, int, int]
+
+def _analyzer(kind: str, epsilon: float, critical_points: Optional[Dict[str, float]]):
+    """Build the analyzer a task kind evaluates with."""
+    analyzer = (DimensionalCouplingAnalyzer if kind == 'flow' else WaveGeometryAnalyzer)(epsilon)
+    if critical_points is not None:
+        analyzer.critical_points = dict(critical_points)
+    return analyzer
+
+def _evaluate(kind: str, analyzer, dims: np.ndarray) -> Dict[str, np.ndarray]:
+    """Evaluate the pointwise part of a sweep on a dimension chunk."""
+    if kind == 'flow':
+        return analyzer.flow_from_states(dims, analyzer.compute_coupling_states(dims))
+    return analyzer.wave_metrics(dims)
+
+def _run_task(task: SweepTask) -> int:
+    """Evaluate a task and write its slice into shared memory.
+
+    Returns:
+        Number of points written
+    """
+    keys = FLOW_KEYS if task.kind == 'flow' else METRIC_KEYS
+    dims = linspace_chunk(task.d1, task.d2, task.points, task.i0, task.i1)
+    result = _evaluate(task.kind, _analyzer(task.kind, task.epsilon, task.critical_points), dims)
+
+    shm = shared_memory.SharedMemory(name=task.shm_name)
+    try:
+        out = np.ndarray(task.shape, dtype=np.float64, buffer=shm.buf)
+        for k, key in enumerate(keys):
+            out[task.slot, k, task.i0:task.i1] = result[key]
+        del out
+    finally:
+        shm.close()
+    return task.i1 - task.i0
+
+class ParallelSweep:
+    """Run coupling and wave sweeps across a process pool.
+
+    Dimension ranges are split into contiguous index blocks of the linspace
+    grid, so reassembled results match the serial analyzers' output on the
+    same grid (coupling flow to rounding, since each block evaluates its own
+    neighbour stencil). Parameter sweeps run one grid per parameter set, each split
+    the same way. The pool is created on first use and reused until close().
+
+    Attributes:
+        workers: Number of worker processes
+        min_chunk: Smallest block of points handed to a single task
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_chunk: int = 4096):
+        """Configure the pool.
+
+        Args:
+            workers: Worker processes (os.cpu_count() by default)
+            min_chunk: Smallest block of points worth a separate task
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = max(1, min_chunk)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelSweep':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def coupling_flow(self, d1: float, d2: float, points: int = 401,
+                      epsilon: float = 1e-10,
+                      critical_points: Optional[Dict[str, float]] = None) -> Dict[str, np.ndarray]:
+        """Parallel DimensionalCouplingAnalyzer.coupling_flow.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            points: Number of sampling points
+            epsilon: Numerical safety threshold
+            critical_points: Optional replacement critical point table
+
+        Returns:
+            Coupling flow dictionary over np.linspace(d1, d2, points)
+        """
+        return self.sweep('flow', d1, d2, points, [dict(epsilon=epsilon,
+                                                        critical_points=critical_points)])[0]
+
+    def analyze_interference(self, d1: float, d2: float, points: int = 101,
+                             epsilon: float = 1e-10,
+                             critical_points: Optional[Dict[str, float]] = None) -> Dict[str, np.ndarray]:
+        """Parallel WaveGeometryAnalyzer.analyze_interference.
+
+        Wave metrics are evaluated in the workers; the phase velocity
+        gradient needs neighbouring samples across block edges and is taken
+        in the parent over the reassembled grid.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            points: Number of sampling points
+            epsilon: Numerical safety threshold
+            critical_points: Optional replacement critical point table
+
+        Returns:
+            Dictionary of interference metrics across the dimension range
+        """
+        return self.interference_sweep(d1, d2, points, [dict(epsilon=epsilon,
+                                                              critical_points=critical_points)])[0]
+
+    def find_stable_states(self, d_range: Tuple[float, float], threshold: float = 0.8,
+                           points: int = 1001, epsilon: float = 1e-10,
+                           critical_points: Optional[Dict[str, float]] = None) -> List[float]:
+        """Parallel WaveGeometryAnalyzer.find_stable_states on a uniform grid.
+
+        Args:
+            d_range: (min_dimension, max_dimension) to search
+            threshold: Minimum stability, coherence and resonance
+            points: Size of the search grid
+            epsilon: Numerical safety threshold
+            critical_points: Optional replacement critical point table
+
+        Returns:
+            List of dimensions with stable configurations
+        """
+        return self.stable_sweep(d_range, [dict(epsilon=epsilon, critical_points=critical_points)],
+                                 threshold, points)[0]
+
+    def interference_sweep(self, d1: float, d2: float, points: int,
+                           params: Sequence[Dict[str, Any]]) -> List[Dict[str, np.ndarray]]:
+        """Interference analysis for each parameter set, in order.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            points: Number of sampling points
+            params: Parameter sets with optional 'epsilon' and 'critical_points'
+
+        Returns:
+            One interference dictionary per parameter set
+        """
+        dims = np.linspace(d1, d2, points)
+        wave = WaveGeometryAnalyzer()
+        return [wave.interference_from_metrics(dims, metrics)
+                for metrics in self.sweep('metrics', d1, d2, points, params)]
+
+    def stable_sweep(self, d_range: Tuple[float, float], params: Sequence[Dict[str, Any]],
+                     threshold: float = 0.8, points: int = 1001) -> List[List[float]]:
+        """Stable state search for each parameter set, in order.
+
+        Args:
+            d_range: (min_dimension, max_dimension) to search
+            params: Parameter sets with optional 'epsilon' and 'critical_points'
+            threshold: Minimum stability, coherence and resonance
+            points: Size of the search grid
+
+        Returns:
+            One list of stable dimensions per parameter set
+        """
+        dims = np.linspace(*d_range, points)
+        wave = WaveGeometryAnalyzer()
+        return [dims[wave.stable_mask(metrics, threshold)].tolist()
+                for metrics in self.sweep('metrics', *d_range, points, params)]
+
+    def sweep(self, kind: str, d1: float, d2: float, points: int,
+              params: Sequence[Dict[str, Any]]) -> List[Dict[str, np.ndarray]]:
+        """Evaluate a pointwise analysis for several parameter sets.
+
+        Every (parameter set, index block) pair becomes one task; blocks are
+        sized so the pool receives about four tasks per worker in total.
+
+        Args:
+            kind: 'flow' for coupling flow, 'metrics' for wave metrics
+            d1: Starting dimension
+            d2: Ending dimension
+            points: Number of sampling points
+            params: Parameter sets with optional 'epsilon' and 'critical_points'
+
+        Returns:
+            One result dictionary per parameter set, keyed as the serial method
+        """
+        if kind not in ('flow', 'metrics'):
+            raise ValueError(f"Unknown sweep kind: {kind}")
+        keys = FLOW_KEYS if kind == 'flow' else METRIC_KEYS
+        shape = (len(params), len(keys), points)
+        if not params or points < 1:
+            return [{key: np.empty(0) for key in keys} for _ in params]
+
+        blocks = -(-4 * self.workers // len(params))
+        size = max(self.min_chunk, -(-points // blocks))
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            tasks = [SweepTask(kind, float(d1), float(d2), points, i0, min(i0 + size, points),
+                               slot, p.get('epsilon', 1e-10), p.get('critical_points'),
+                               shm.name, shape)
+                     for slot, p in enumerate(params)
+                     for i0 in range(0, points, size)]
+            if self.workers == 1 or len(tasks) == 1:
+                for task in tasks:
+                    _run_task(task)
+            else:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(self.workers)
+                for _ in self._executor.map(_run_task, tasks):
+                    pass
+            out = np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        return [dict(zip(keys, block)) for block in out]
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return f"ParallelSweep(workers={self.workers}, min_chunk={self.min_chunk})"
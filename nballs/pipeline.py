@@ -0,0 +1,125 @@
+"""Fused geometric pipeline shared by the coupling and wave analyzers.
+
+Both DimensionalCouplingAnalyzer and WaveGeometryAnalyzer build on the same
+geometric states: coupling flow reads them at d-1, d and d+1, while wave
+interference, stability and void ratio read them at d. This module evaluates
+that geometry once on a dimension grid and lets each analysis consume it,
+computing every derived quantity at most once.
+"""
+
+__package__ = 'nballs'
+
+import numpy as np
+from functools import cached_property
+from typing import Dict, List, Optional, Any
+from .core import DimensionStencil, GeometricStateBatch
+from .coupling import DimensionalCouplingAnalyzer
+from .wave import WaveGeometryAnalyzer, WaveStateBatch
+
+class GeometryPipeline:
+    """One-pass geometric evaluation feeding several analyzers.
+
+    The geometric stencil is evaluated lazily on first use and shared by
+    coupling flow, wave states, interference, stability search and void
+    ratio. Each of those is itself cached, so a combined report costs one
+    geometric pass regardless of how many analyses read from it.
+
+    Attributes:
+        dims: Dimension grid as given
+        coupling: Analyzer providing the coupling flow
+        wave: Analyzer providing wave states and interference
+    """
+
+    def __init__(self, dims: np.ndarray, epsilon: float = 1e-10,
+                 critical_points: Optional[Dict[str, float]] = None,
+                 recurrence: bool = False):
+        """Set up analyzers for a dimension grid.
+
+        Args:
+            dims: Dimension grid shared by every analysis
+            epsilon: Numerical safety threshold
+            critical_points: Optional replacement critical point table
+            recurrence: Evaluate the stencil through the volume ladder
+        """
+        self.dims = np.atleast_1d(np.asarray(dims, dtype=float))
+        self.recurrence = recurrence
+        self.coupling = DimensionalCouplingAnalyzer(epsilon)
+        self.wave = WaveGeometryAnalyzer(epsilon)
+        if critical_points is not None:
+            self.coupling.critical_points = dict(critical_points)
+            self.wave.critical_points = dict(critical_points)
+
+    @cached_property
+    def clamped(self) -> np.ndarray:
+        """Dimensions clamped to epsilon, as both analyzers evaluate them."""
+        return np.maximum(self.coupling.epsilon, self.dims)
+
+    @cached_property
+    def stencil(self) -> DimensionStencil:
+        """Geometric states at the clamped dims and their unit neighbours."""
+        return self.coupling.stencil(self.clamped, recurrence=self.recurrence)
+
+    @property
+    def geometry(self) -> GeometricStateBatch:
+        """Geometric states at the clamped dims."""
+        return self.stencil[0]
+
+    @property
+    def evaluations(self) -> int:
+        """Number of dimensions evaluated through gamma so far."""
+        return self.stencil.evaluations
+
+    @cached_property
+    def coupling_flow(self) -> Dict[str, np.ndarray]:
+        """Coupling flow over the grid, as DimensionalCouplingAnalyzer.coupling_flow."""
+        states = self.coupling.compute_coupling_states(self.clamped, stencil=self.stencil)
+        return self.coupling.flow_from_states(self.dims, states)
+
+    @cached_property
+    def wave_states(self) -> WaveStateBatch:
+        """Wave states over the grid, as WaveGeometryAnalyzer.compute_wave_states."""
+        return self.wave.compute_wave_states(self.clamped, geometry=self.geometry)
+
+    @cached_property
+    def wave_metrics(self) -> Dict[str, np.ndarray]:
+        """Coherence, energy, stability, resonance and phase over the grid."""
+        return self.wave.wave_metrics(self.clamped, self.wave_states)
+
+    @cached_property
+    def interference(self) -> Dict[str, np.ndarray]:
+        """Interference metrics, as WaveGeometryAnalyzer.analyze_interference."""
+        return self.wave.interference_from_metrics(self.dims, self.wave_metrics)
+
+    @cached_property
+    def void_ratio(self) -> np.ndarray:
+        """Void ratio over the grid, as NBallCore.void_ratio."""
+        void = self.wave.void_ratio(self.clamped, geometry=self.geometry)
+        return np.where(self.dims <= 0, 1.0, void)
+
+    def stable_states(self, threshold: float = 0.8) -> List[float]:
+        """Grid dimensions meeting the find_stable_states criteria.
+
+        Args:
+            threshold: Minimum stability, coherence and resonance
+
+        Returns:
+            List of stable dimensions
+        """
+        return self.dims[self.wave.stable_mask(self.wave_metrics, threshold)].tolist()
+
+    def report(self, threshold: float = 0.8) -> Dict[str, Any]:
+        """Collect every analysis over the grid from the shared geometry.
+
+        Args:
+            threshold: Stability threshold for the stable state search
+
+        Returns:
+            Dictionary of coupling flow, interference, stable states and void ratio
+        """
+        return {
+            'dimensions': self.dims,
+            'coupling_flow': self.coupling_flow,
+            'interference': self.interference,
+            'stable_states': self.stable_states(threshold),
+            'void_ratio': self.void_ratio
+        }
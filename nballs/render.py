@@ -0,0 +1,118 @@
+"""Content-addressed render cache for generated figures.
+
+Figure scripts used to write a new timestamped PNG on every run, even when
+nothing that feeds the figure had changed. A RenderCache names each
+artifact after a hash of what determines it: the producing class, its
+parameters and the source code involved. A run whose inputs match an
+existing artifact returns that file without drawing anything, and a run
+that does draw writes to a temporary file first and moves it into place
+atomically, so readers never see a partial image.
+"""
+
+__package__ = 'nballs'
+
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+PathLike = Union[str, os.PathLike]
+
+def _canonical(value: Any) -> Any:
+    """Convert parameters into a stable JSON-serializable form."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {'__type__': type(value).__qualname__, **_canonical(asdict(value))}
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return {'dtype': value.dtype.str, 'shape': list(value.shape),
+                'sha256': hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()}
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    name = getattr(value, 'name', None)
+    return {'__type__': type(value).__qualname__, 'name': name} if name else repr(value)
+
+def package_sources() -> List[Path]:
+    """Source files of the nballs package, for keys of nballs-driven figures."""
+    return sorted(Path(__file__).resolve().parent.glob('*.py'))
+
+class RenderCache:
+    """Reuse rendered figures whose inputs have not changed.
+
+    Attributes:
+        directory: Directory holding rendered artifacts
+    """
+
+    def __init__(self, directory: PathLike = '.'):
+        """Set up a cache rooted at directory.
+
+        Args:
+            directory: Where artifacts are written and looked up
+        """
+        self.directory = Path(directory)
+
+    def key(self, kind: str, params: Dict[str, Any],
+            sources: Iterable[PathLike] = ()) -> str:
+        """Hash the producing class, its parameters and the code involved.
+
+        Args:
+            kind: Name of the class or job producing the figure
+            params: Parameters that determine the figure
+            sources: Source files whose content determines the figure
+
+        Returns:
+            Hex digest identifying the artifact
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps({'kind': kind, 'params': _canonical(params)},
+                                 sort_keys=True).encode())
+        for path in sorted({Path(p).resolve() for p in sources}):
+            digest.update(path.name.encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def render(self, pattern: str, draw: Callable[[str], None], kind: str,
+               params: Optional[Dict[str, Any]] = None,
+               sources: Iterable[PathLike] = (), force: bool = False) -> str:
+        """Return the artifact for these inputs, drawing it only if missing.
+
+        Args:
+            pattern: File name containing '{key}', e.g. 'figure-{key}.png'
+            draw: Writes the figure to the path it is given; the path keeps
+                the pattern's extension so savefig infers the format
+            kind: Name of the class or job producing the figure
+            params: Parameters that determine the figure
+            sources: Source files whose content determines the figure
+            force: Redraw even when a matching artifact exists
+
+        Returns:
+            Path of the (possibly reused) artifact
+        """
+        name = pattern.format(key=self.key(kind, params or {}, sources)[:16])
+        path = self.directory / name
+        if path.exists() and not force:
+            return str(path)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = str(self.directory / f'.{path.stem}.{os.getpid()}.{uuid.uuid4().hex[:8]}{path.suffix}')
+        try:
+            draw(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return str(path)
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return f"RenderCache(directory='{self.directory}')"
@@ -0,0 +1,280 @@
+"""Piecewise Chebyshev surrogates for NBallCore measurements.
+
+Workloads that evaluate volume, surface, radius, freedom and phase over a
+fixed dimension window many times pay for gamma evaluations on every call.
+A ChebyshevSurrogate fits each measurement once on the window, splitting it
+into dyadic pieces until every piece meets a requested accuracy, and then
+evaluates by table lookup and Horner's rule, with no gamma calls.
+Surrogates serialize to a single .npz file so the fit runs once and later
+processes only load the coefficients.
+"""
+
+__package__ = 'nballs'
+
+import os
+import numpy as np
+from numpy.polynomial import chebyshev, polynomial
+from typing import Dict, Tuple, Sequence, Optional, Callable
+from .core import NBallCore, ArrayLike
+
+FUNCTIONS = ('volume', 'surface', 'radius', 'freedom', 'phase')
+
+# Points evaluated per pass, small enough for the gathered coefficient
+# rows and Horner temporaries to stay in cache
+CHUNK = 8192
+
+def _signed_freedom(core: NBallCore, d: np.ndarray) -> np.ndarray:
+    """Geometric freedom before its absolute value.
+
+    With S(d) = d·V(d) the freedom is V(d)·√(d² + τ²)·|sin(d·arctan(d/τ))|.
+    Dropping the absolute value removes the kinks at its zeros, so the
+    signed form is smooth and fits with low-degree polynomials.
+    """
+    v = core.ball_volume(d)
+    signed = v * np.hypot(d, core.tau) * np.sin(d * np.arctan2(d, core.tau))
+    return np.where(abs(v) < core.epsilon, 0.0, signed)
+
+def _references(core: NBallCore) -> Dict[str, Callable[[np.ndarray], np.ndarray]]:
+    """Functions fitted by the surrogate, keyed by measurement name."""
+    return {
+        'volume': core.ball_volume,
+        'surface': core.ball_surface,
+        'radius': core.ball_radius,
+        'freedom': lambda d: _signed_freedom(core, d),
+        'phase': lambda d: np.arctan2(core.ball_surface(d + 1), core.tau * core.ball_volume(d))
+    }
+
+def _exact(core: NBallCore, name: str, d: np.ndarray) -> np.ndarray:
+    """Evaluate a measurement through NBallCore itself."""
+    if name == 'freedom':
+        return core.geometric_freedom(d)
+    return _references(core)[name](d)
+
+class ChebyshevSurrogate:
+    """Piecewise Chebyshev approximation of NBallCore over a dimension window.
+
+    The window [d_min, d_max] is bisected into dyadic pieces. On each piece
+    every measurement is interpolated at degree + 1 Chebyshev nodes and
+    stored in the power basis of the piece's local variable t ∈ [-1, 1],
+    which evaluates by Horner's rule. A piece is split again while any
+    interpolant misses its reference by more than tol times that
+    measurement's largest magnitude on the window, checked on a grid twice
+    as fine after the change of basis. Freedom is fitted in its signed form
+    and its absolute value taken on evaluation. Radius is returned as zero
+    at d ≤ 0, as in ball_radius; just above zero the fit is more accurate
+    than ball_radius itself, whose V^(-1/d) cancels as d → 0. Points
+    outside the window fall back to NBallCore.
+
+    Dyadic pieces make lookup O(1): a table over the finest level maps each
+    cell of the window straight to its piece. Points are evaluated in
+    chunks of CHUNK, gathering each point's coefficient row once per chunk.
+
+    Attributes:
+        window: (d_min, d_max) covered by the fit
+        tol: Relative accuracy target the fit was built for
+        degree: Polynomial degree per piece
+        names: Measurements available
+        max_error: Largest checked error per measurement, relative to scale
+    """
+
+    def __init__(self, window: Tuple[float, float], tol: float, degree: int,
+                 edges: np.ndarray, lookup: np.ndarray, coeffs: Dict[str, np.ndarray],
+                 max_error: Dict[str, float], epsilon: float = 1e-10):
+        """Assemble a surrogate from fitted tables; use build() or load().
+
+        Args:
+            window: (d_min, d_max) covered by the fit
+            tol: Relative accuracy target
+            degree: Polynomial degree per piece
+            edges: Array of shape (pieces, 2) with each piece's bounds
+            lookup: Piece index for every cell of the finest dyadic level
+            coeffs: Power-basis coefficients of shape (pieces, degree + 1)
+                per name, lowest order first
+            max_error: Largest checked relative error per name
+            epsilon: Safety threshold of the NBallCore used outside the window
+        """
+        self.window = (float(window[0]), float(window[1]))
+        self.tol = float(tol)
+        self.degree = int(degree)
+        self.edges = edges
+        self.lookup = lookup
+        self._mid = edges.mean(axis=1)
+        self._inv_half = 2 / (edges[:, 1] - edges[:, 0])
+        self.coeffs = coeffs
+        self.names = tuple(coeffs)
+        self.max_error = max_error
+        self.core = NBallCore(epsilon)
+
+    @classmethod
+    def build(cls, core: Optional[NBallCore] = None,
+              window: Tuple[float, float] = (0.0, 4*np.pi), tol: float = 1e-10,
+              degree: int = 8, functions: Sequence[str] = FUNCTIONS,
+              max_depth: int = 16) -> 'ChebyshevSurrogate':
+        """Fit a surrogate to NBallCore measurements.
+
+        Args:
+            core: Source of the reference values (a default NBallCore if None)
+            window: (d_min, d_max) to cover; d_min must be non-negative
+            tol: Maximum error relative to each measurement's scale
+            degree: Polynomial degree per piece
+            functions: Measurements to fit, from FUNCTIONS
+            max_depth: Deepest dyadic level a piece may be split to
+
+        Returns:
+            Fitted surrogate
+
+        Raises:
+            ValueError: If the window, degree or a function name is invalid, or the
+                target is not met by max_depth
+        """
+        core = core if core is not None else NBallCore()
+        d_min, d_max = float(window[0]), float(window[1])
+        if not 0 <= d_min < d_max:
+            raise ValueError(f"Window must satisfy 0 <= d_min < d_max, got {window}")
+        unknown = set(functions) - set(FUNCTIONS)
+        if unknown:
+            raise ValueError(f"Unknown functions: {sorted(unknown)}")
+        if degree < 1:
+            raise ValueError(f"Degree must be at least 1, got {degree}")
+
+        refs = {name: _references(core)[name] for name in functions}
+        probe = np.linspace(d_min, d_max, 64 * (degree + 1))
+        scale = {name: max(np.max(np.abs(f(probe))), core.epsilon) for name, f in refs.items()}
+
+        nodes = chebyshev.chebpts1(degree + 1)
+        checks = np.cos(np.pi * (np.arange(2 * degree + 1) + 0.5) / (2 * degree + 1))
+        pieces, coeffs = [], {name: [] for name in refs}
+        max_error = {name: 0.0 for name in refs}
+
+        # Depth-first over (level, index) keeps pieces sorted along the window
+        stack = [(0, 0)]
+        width = d_max - d_min
+        while stack:
+            level, index = stack.pop()
+            lo = d_min + width * index / 2**level
+            hi = d_min + width * (index + 1) / 2**level
+            mid, half = (lo + hi) / 2, (hi - lo) / 2
+
+            fitted, errors = {}, {}
+            for name, f in refs.items():
+                c = chebyshev.cheb2poly(chebyshev.chebfit(nodes, f(mid + half * nodes), degree))
+                err = np.max(np.abs(polynomial.polyval(checks, c) - f(mid + half * checks)))
+                fitted[name], errors[name] = c, err / scale[name]
+
+            if max(errors.values()) > tol:
+                if level == max_depth:
+                    raise ValueError(f"Tolerance {tol} not reached by depth {max_depth} "
+                                     f"near d={mid:.6g}; raise degree or max_depth")
+                stack.extend([(level + 1, 2*index + 1), (level + 1, 2*index)])
+                continue
+
+            pieces.append((level, index, lo, hi))
+            for name in refs:
+                coeffs[name].append(fitted[name])
+                max_error[name] = max(max_error[name], errors[name])
+
+        depth = max(level for level, *_ in pieces)
+        lookup = np.empty(2**depth, dtype=np.int32)
+        for i, (level, index, _, _) in enumerate(pieces):
+            span = 2**(depth - level)
+            lookup[index * span:(index + 1) * span] = i
+
+        edges = np.array([(lo, hi) for *_, lo, hi in pieces])
+        return cls((d_min, d_max), tol, degree, edges, lookup,
+                   {name: np.array(c) for name, c in coeffs.items()},
+                   max_error, core.epsilon)
+
+    @property
+    def pieces(self) -> int:
+        """Number of polynomial pieces."""
+        return len(self.edges)
+
+    def evaluate(self, d: ArrayLike, names: Optional[Sequence[str]] = None) -> Dict[str, ArrayLike]:
+        """Evaluate several measurements sharing one piece lookup.
+
+        Args:
+            d: Dimension or array of dimensions
+            names: Measurements to evaluate (all fitted ones by default)
+
+        Returns:
+            Dictionary of values shaped like d
+        """
+        names = self.names if names is None else tuple(names)
+        d = np.asarray(d, dtype=float)
+        flat = d.ravel()
+        d_min, d_max = self.window
+        inside = (flat >= d_min) & (flat <= d_max)
+        every = inside.all()
+        x = flat if every else flat[inside]
+
+        values = {name: np.empty_like(x) for name in names}
+        for start in range(0, len(x), CHUNK):
+            chunk = slice(start, start + CHUNK)
+            piece, t = self._locate(x[chunk])
+            for name in names:
+                self._horner(self.coeffs[name], piece, t, values[name][chunk])
+
+        result = {}
+        for name, y in values.items():
+            if name == 'freedom':
+                np.abs(y, out=y)
+            elif name == 'radius':
+                y[x <= 0] = 0.0
+            if not every:
+                out = np.empty_like(flat)
+                out[inside] = y
+                out[~inside] = _exact(self.core, name, flat[~inside])
+                y = out
+            result[name] = y.reshape(d.shape)[()]
+        return result
+
+    def __call__(self, name: str, d: ArrayLike) -> ArrayLike:
+        """Evaluate a single measurement."""
+        return self.evaluate(d, (name,))[name]
+
+    def _locate(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Piece index and local coordinate t ∈ [-1, 1] of points in the window."""
+        d_min, d_max = self.window
+        cells = len(self.lookup)
+        cell = ((x - d_min) * (cells / (d_max - d_min))).astype(np.intp)
+        np.minimum(cell, cells - 1, out=cell)
+        piece = np.take(self.lookup, cell)
+        return piece, (x - np.take(self._mid, piece)) * np.take(self._inv_half, piece)
+
+    def _horner(self, c: np.ndarray, piece: np.ndarray, t: np.ndarray, out: np.ndarray):
+        """Evaluate each point's piece polynomial at its local coordinate into out."""
+        rows = np.take(c, piece, axis=0)
+        out[:] = rows[:, -1]
+        for k in range(c.shape[1] - 2, -1, -1):
+            out *= t
+            out += rows[:, k]
+
+    def save(self, path: str):
+        """Atomically write the surrogate to an .npz file at exactly path."""
+        directory, name = os.path.split(os.path.abspath(path))
+        tmp = os.path.join(directory, f'.{name}.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, window=np.array(self.window), tol=self.tol, degree=self.degree,
+                     edges=self.edges, lookup=self.lookup, epsilon=self.core.epsilon,
+                     names=np.array(self.names),
+                     max_error=np.array([self.max_error[n] for n in self.names]),
+                     **{f'coeffs_{n}': self.coeffs[n] for n in self.names})
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'ChebyshevSurrogate':
+        """Read a surrogate written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            names = [str(n) for n in data['names']]
+            return cls(tuple(data['window']), float(data['tol']), int(data['degree']),
+                       data['edges'], data['lookup'],
+                       {n: data[f'coeffs_{n}'] for n in names},
+                       dict(zip(names, data['max_error'].tolist())),
+                       float(data['epsilon']))
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return (f"ChebyshevSurrogate(window={self.window}, tol={self.tol}, "
+                f"degree={self.degree}, pieces={self.pieces})")
@@ -14,11 +14,10 @@ from phase coherence between adjacent dimensions.
 __package__ = 'nballs'
 
 import numpy as np
-from datetime import datetime
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
-from typing import Dict, Tuple, List, Optional
-from .core import NBallCore, GeometricState
+from dataclasses import dataclass, fields
+from typing import Dict, Tuple, List, Optional, Union
+from .core import (NBallCore, GeometricState, GeometricStateBatch, DimensionStencil,
+                   ArrayLike, shaped_like)
 
 @dataclass
 class WaveState:
@@ -41,6 +40,43 @@ class WaveState:
     resonance: float
     stability: float
 
+@dataclass
+class WaveStateBatch:
+    """Columnar container of wave states across many dimensions.
+
+    Holds one contiguous array per WaveState field, with complex128 wave
+    components. Integer indexing returns the WaveState at that position,
+    while slices and index arrays return a narrower batch.
+
+    Attributes:
+        dimension: Dimensions being analyzed
+        psi_forward: Forward-propagating wave components
+        psi_backward: Backward-propagating wave components
+        energy: Total geometric energies
+        coherence: Phase coherence measures
+        resonance: Resonance strengths with adjacent dimensions
+        stability: State stability measures
+    """
+    dimension: np.ndarray
+    psi_forward: np.ndarray
+    psi_backward: np.ndarray
+    energy: np.ndarray
+    coherence: np.ndarray
+    resonance: np.ndarray
+    stability: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dimension)
+
+    def __getitem__(self, index) -> Union[WaveState, 'WaveStateBatch']:
+        values = {f.name: getattr(self, f.name)[index] for f in fields(self)}
+        if np.ndim(values['dimension']) == 0:
+            return WaveState(**values)
+        return WaveStateBatch(**values)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
 class WaveGeometryAnalyzer(NBallCore):
     """Analyzer for wave-like behavior in dimensional evolution.
 
@@ -117,20 +153,82 @@ class WaveGeometryAnalyzer(NBallCore):
             stability=stability
         )
 
-    def analyze_transitions(self, d: float) -> Dict[str, float]:
+    def compute_wave_states(self, dims: np.ndarray,
+                            geometry: Optional[GeometricStateBatch] = None) -> WaveStateBatch:
+        """Compute wave states over an array of dimensions at once.
+
+        Vectorized counterpart of compute_wave_state: the geometric states
+        come from one analyze_dimensions call and every safety guard is a
+        mask, so a whole sweep is a handful of array operations.
+
+        Args:
+            dims: Dimensions to analyze
+            geometry: Precomputed geometric states at the clamped dims,
+                shared with other analyses
+
+        Returns:
+            WaveStateBatch with one entry per dimension
+        """
+        # Get geometric states with safety bounds
+        d = np.maximum(self.epsilon, np.atleast_1d(np.asarray(dims, dtype=float)))
+        geo = geometry if geometry is not None else self.analyze_dimensions(d)
+
+        theta = d/(2*np.pi)
+        decay = np.exp(-theta/4)  # Amplitude decay
+        amplitude = decay * np.maximum(geo.freedom, self.epsilon)
+
+        # Forward and backward waves with phase preservation
+        rotation = np.exp(1j*theta)
+        psi_f = amplitude * rotation
+        psi_b = amplitude * np.conj(rotation)
+
+        # Safe energy normalization
+        total_amp = np.abs(psi_f) + np.abs(psi_b)
+        combined = np.abs(psi_f + psi_b)
+        energy = combined**2 / (1 + d)
+        coherence = np.where(total_amp > self.epsilon,
+                             combined/(total_amp + self.epsilon), 0.0)
+
+        # Resonance around the principal quantum number
+        resonance = np.exp(-2*(theta - np.round(theta))**2) * geo.coupling
+
+        # Stability metric incorporating phase coherence
+        phase_diff = np.abs(np.angle(psi_f) - np.angle(psi_b))
+        stability = np.abs(np.sin(theta * np.pi/2) * coherence *
+                           np.cos(phase_diff/2))
+
+        return WaveStateBatch(
+            dimension=d,
+            psi_forward=psi_f,
+            psi_backward=psi_b,
+            energy=energy,
+            coherence=coherence,
+            resonance=resonance,
+            stability=stability
+        )
+
+    def analyze_transitions(self, d: ArrayLike) -> Dict[str, ArrayLike]:
         """Analyze quantum transitions between adjacent dimensions.
 
         Examines how wave states evolve across dimensions, revealing
-        patterns in phase coherence and energy transfer.
+        patterns in phase coherence and energy transfer. Arrays of
+        dimensions are handled in one pass: the d-1, d and d+1 wave states
+        come from a single stencil evaluation, so adjacent grid points share
+        their neighbour states; a scalar d uses compute_wave_state, which
+        goes through the analyze_dimension cache when it is enabled.
 
         Args:
-            d: Central dimension for analysis
+            d: Central dimension (or array of dimensions) for analysis
 
         Returns:
-            Dictionary of transition metrics
+            Dictionary of transition metrics, each shaped like d
         """
         # Get states for d-1, d, d+1
-        states = [self.compute_wave_state(d + offset) for offset in [-1, 0, 1]]
+        if isinstance(d, (int, float)):
+            states = [self.compute_wave_state(d + offset) for offset in [-1, 0, 1]]
+        else:
+            st = self.wave_stencil(d)
+            states = [st[offset] for offset in [-1, 0, 1]]
 
         # Transition amplitudes
         t_down = np.abs(states[1].psi_backward * np.conj(states[0].psi_forward))
@@ -144,15 +242,27 @@ class WaveGeometryAnalyzer(NBallCore):
         phase_advance = np.angle(states[2].psi_forward) - np.angle(states[1].psi_forward)
 
         return {
-            'transition_down': t_down,
-            'transition_up': t_up,
-            'energy_down': e_down,
-            'energy_up': e_up,
-            'phase_advance': phase_advance,
-            'coherence': states[1].coherence,
-            'stability': states[1].stability
+            'transition_down': shaped_like(t_down, d),
+            'transition_up': shaped_like(t_up, d),
+            'energy_down': shaped_like(e_down, d),
+            'energy_up': shaped_like(e_up, d),
+            'phase_advance': shaped_like(phase_advance, d),
+            'coherence': shaped_like(states[1].coherence, d),
+            'stability': shaped_like(states[1].stability, d)
         }
 
+    def wave_stencil(self, dims: ArrayLike, reach: int = 1) -> DimensionStencil:
+        """Build a stencil of wave states at dims + k for |k| ≤ reach.
+
+        Args:
+            dims: Grid of dimensions
+            reach: Largest unit shift needed
+
+        Returns:
+            DimensionStencil serving WaveStateBatch views
+        """
+        return DimensionStencil(dims, self.compute_wave_states, reach)
+
     def resonance_pattern(self, d: float) -> Tuple[complex, float, float]:
         """Analyze resonance pattern through phase space.
 
@@ -197,17 +307,69 @@ class WaveGeometryAnalyzer(NBallCore):
             Dictionary of interference metrics across dimension range
         """
         dims = np.linspace(d1, d2, points)
+        return self.interference_from_metrics(dims, self.wave_metrics(dims))
+
+    def adaptive_interference(self, d1: float, d2: float, tol: float = 1e-3,
+                              keys: Tuple[str, ...] = ('coherence', 'stability'),
+                              max_points: int = 4096, **kwargs) -> Dict[str, np.ndarray]:
+        """Analyze interference on an adaptively refined dimension grid.
+
+        Seeds the grid with the critical points and refines where the
+        selected metrics curve sharply; see NBallCore.adaptive_sample.
+        Phase velocity is taken on the resulting non-uniform grid.
+
+        Args:
+            d1: Starting dimension
+            d2: Ending dimension
+            tol: Relative interpolation error tolerated per interval
+            keys: Metrics that drive refinement
+            max_points: Evaluation budget
+            **kwargs: Further options for adaptive_sample
+
+        Returns:
+            Dictionary of interference metrics over the non-uniform grid
+        """
+        sample = self.adaptive_sample(
+            self.wave_metrics, d1, d2, keys, tol=tol, max_points=max_points,
+            seeds=list(self.critical_points.values()), **kwargs)
+        return self.interference_from_metrics(sample.pop('dimensions'), sample)
+
+    def wave_metrics(self, dims: np.ndarray,
+                     states: Optional[WaveStateBatch] = None) -> Dict[str, np.ndarray]:
+        """Collect per-dimension wave metrics as arrays.
+
+        Args:
+            dims: Dimensions to evaluate
+            states: Precomputed wave states at dims
+
+        Returns:
+            Coherence, energy, stability, resonance and phase arrays
+        """
+        states = states if states is not None else self.compute_wave_states(dims)
+        return {
+            'coherence': states.coherence,
+            'energy': states.energy,
+            'stability': states.stability,
+            'resonance': states.resonance,
+            'phase': np.angle(states.psi_forward)
+        }
+
+    def interference_from_metrics(self, dims: np.ndarray,
+                                  metrics: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Combine wave metrics into the interference dictionary.
 
-        # Collect wave states
-        states = [self.compute_wave_state(d) for d in dims]
+        Args:
+            dims: Dimensions the metrics were evaluated at, in order
+            metrics: Output of wave_metrics
 
-        # Extract key metrics
-        coherence = np.array([s.coherence for s in states])
-        energy = np.array([s.energy for s in states])
-        stability = np.array([s.stability for s in states])
+        Returns:
+            Interference dictionary, as analyze_interference
+        """
+        coherence = metrics['coherence']
+        stability = metrics['stability']
 
         # Phase evolution
-        phase = np.array([np.angle(s.psi_forward) for s in states])
+        phase = metrics['phase']
         phase_vel = np.gradient(phase, dims)
 
         # Interference strength
@@ -216,7 +378,7 @@ class WaveGeometryAnalyzer(NBallCore):
         return {
             'dimensions': dims,
             'coherence': coherence,
-            'energy': energy,
+            'energy': metrics['energy'],
             'stability': stability,
             'phase': phase,
             'phase_velocity': phase_vel,
@@ -224,7 +386,8 @@ class WaveGeometryAnalyzer(NBallCore):
         }
 
     def find_stable_states(self, d_range: Tuple[float, float],
-                          threshold: float = 0.8) -> List[float]:
+                          threshold: float = 0.8, adaptive: bool = False,
+                          tol: float = 1e-3) -> List[float]:
         """Find stable geometric configurations through wave analysis.
 
         Identifies dimensions with high coherence and stability,
@@ -233,24 +396,85 @@ class WaveGeometryAnalyzer(NBallCore):
         Args:
             d_range: (min_dimension, max_dimension) to search
             threshold: Minimum stability for state selection
+            adaptive: Sample on a grid refined where stability, coherence
+                and resonance vary sharply instead of 1001 uniform points
+            tol: Refinement tolerance when adaptive
 
         Returns:
             List of dimensions with stable configurations
         """
-        # Sample dimensions
-        dims = np.linspace(*d_range, 1001)
-        stable_dims = []
+        if adaptive:
+            sample = self.adaptive_sample(
+                self.wave_metrics, *d_range, ('stability', 'coherence', 'resonance'),
+                tol=tol, seeds=list(self.critical_points.values()))
+            dims = sample.pop('dimensions')
+        else:
+            dims = np.linspace(*d_range, 1001)
+            sample = self.wave_metrics(dims)
+
+        return dims[self.stable_mask(sample, threshold)].tolist()
+
+    def find_stable_intervals(self, d_range: Tuple[float, float],
+                              threshold: float = 0.8, tol: float = 1e-9,
+                              points: int = 1001) -> List[Tuple[float, float]]:
+        """Find contiguous stable dimension intervals with refined boundaries.
+
+        Evaluates the find_stable_states criteria on a uniform grid, groups
+        consecutive stable samples into intervals and then bisects every
+        interval edge simultaneously until it is bracketed to within tol.
+        Boundaries are reported on their stable side, so each returned
+        interval lies inside the stable region. Regions narrower than the
+        grid spacing may be missed; points sets the detection resolution.
 
-        for d in dims:
-            state = self.compute_wave_state(d)
+        Args:
+            d_range: (min_dimension, max_dimension) to search
+            threshold: Minimum stability, coherence and resonance
+            tol: Width to which each boundary is bracketed, or float
+                resolution if that is coarser
+            points: Size of the detection grid
 
-            # Check stability criteria
-            if (state.stability > threshold and
-                state.coherence > threshold and
-                state.resonance > threshold):
-                stable_dims.append(d)
+        Returns:
+            List of (start, end) stable intervals in increasing order
+        """
+        dims = np.linspace(*d_range, points)
+        stable = self.stable_mask(self.wave_metrics(dims), threshold)
+
+        # Bracket every change between neighbouring samples
+        edges = np.flatnonzero(stable[1:] != stable[:-1])
+        lo, hi = dims[edges], dims[edges + 1]
+        lo_stable = stable[edges]
+        while len(edges) and np.max(hi - lo) > tol:
+            mid = (lo + hi) / 2
+            # Below tol the brackets may reach adjacent floats and stop shrinking
+            if not np.any((lo < mid) & (mid < hi)):
+                break
+            same = self.stable_mask(self.wave_metrics(mid), threshold) == lo_stable
+            lo = np.where(same, mid, lo)
+            hi = np.where(same, hi, mid)
+
+        # Rising edges open an interval, falling edges close one
+        bounds = np.where(lo_stable, lo, hi)
+        starts = list(bounds[~lo_stable])
+        ends = list(bounds[lo_stable])
+        if stable[0]:
+            starts.insert(0, dims[0])
+        if stable[-1]:
+            ends.append(dims[-1])
+        return [(float(a), float(b)) for a, b in zip(starts, ends)]
+
+    def stable_mask(self, metrics: Dict[str, np.ndarray], threshold: float) -> np.ndarray:
+        """Check the find_stable_states criteria on arrays of wave metrics.
 
-        return stable_dims
+        Args:
+            metrics: Output of wave_metrics
+            threshold: Minimum stability, coherence and resonance
+
+        Returns:
+            Boolean array marking stable entries
+        """
+        return ((metrics['stability'] > threshold) &
+                (metrics['coherence'] > threshold) &
+                (metrics['resonance'] > threshold))
 
     def __str__(self) -> str:
         """Return string representation with key information."""
@@ -264,54 +488,68 @@ class WaveGeometryAnalyzer(NBallCore):
 
 if __name__ == '__main__':
     """Create enhanced multi-perspective visualization of wave geometry patterns."""
+    import matplotlib.pyplot as plt
+    from .render import RenderCache, package_sources
+
     # Create analyzer and visualization helper
     analyzer = WaveGeometryAnalyzer()
 
-    # High resolution sampling
+    # High resolution sampling, drawn with at most lod faces per side
     n_points = 401
-    dims = np.linspace(0, 4*np.pi, n_points)
-    phases = np.linspace(0, 2*np.pi, n_points)
-
-    # Create dimension-phase meshgrid
-    D, P = np.meshgrid(dims, phases)
-
-    # Compute wave states
-    states = [analyzer.compute_wave_state(d) for d in dims]
-
-    # Extract wave components
-    wave_components = {
-        'forward_amp': np.array([abs(s.psi_forward) for s in states]),
-        'backward_amp': np.array([abs(s.psi_backward) for s in states]),
-        'phase_diff': np.array([np.angle(s.psi_forward) - np.angle(s.psi_backward)
-                               for s in states]),
-        'coherence': np.array([s.coherence for s in states])
-    }
-
-    # Prepare visualization data
-    vis_data = analyzer.prepare_wave_data(dims, phases, wave_components)
-
-    # Create main figure
-    fig = plt.figure(figsize=(20, 20))
-
-    # Create each subplot with enhanced visualization
-    for idx, view in enumerate(analyzer.standard_views, 1):
-        ax = analyzer.setup_wave_plot(
-            fig, idx, view, D,
+    lod = 50
+    dpi = 300
+    cmap = plt.cm.coolwarm
+
+    def draw(path: str):
+        """Compute the figure data and render it to path."""
+        dims = np.linspace(0, 4*np.pi, n_points)
+        phases = np.linspace(0, 2*np.pi, n_points)
+
+        # Create dimension-phase meshgrid
+        D, P = np.meshgrid(dims, phases)
+
+        # Compute wave states
+        states = analyzer.compute_wave_states(dims)
+
+        # Extract wave components
+        wave_components = {
+            'forward_amp': np.abs(states.psi_forward),
+            'backward_amp': np.abs(states.psi_backward),
+            'phase_diff': np.angle(states.psi_forward) - np.angle(states.psi_backward),
+            'coherence': states.coherence
+        }
+
+        # Prepare visualization data
+        vis_data = analyzer.prepare_wave_data(dims, phases, wave_components)
+
+        # Create main figure
+        fig = plt.figure(figsize=(20, 20))
+
+        # Create each subplot from one shared surface geometry
+        analyzer.render_wave_views(
+            fig, D,
             vis_data['forward'], vis_data['backward'],
-            plt.cm.coolwarm(vis_data['color_metric'])
+            cmap(vis_data['color_metric']),
+            lod=lod
         )
 
-    # Add coherence subplot
-    # analyzer.add_coherence_subplot(fig, dims, wave_components['coherence'])
+        # Add coherence subplot
+        # analyzer.add_coherence_subplot(fig, dims, wave_components['coherence'])
+
+        # Add comprehensive title
+        fig.suptitle('Wave Geometry Analysis\nDimensional Evolution in π Units', fontsize=16, y=0.95)
 
-    # Add comprehensive title
-    fig.suptitle('Wave Geometry Analysis\nDimensional Evolution in π Units', fontsize=16, y=0.95)
+        # Final layout adjustments
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
 
-    # Final layout adjustments
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+        # Save enhanced visualization
+        plt.savefig(path, dpi=dpi, bbox_inches='tight')
+        plt.close()
 
-    # Save enhanced visualization
-    now = datetime.now().strftime('%Y_%m_%d-%I_%M_%S_%p')
-    name = f'nballs-{now}-{analyzer.__class__.__qualname__}.png'
-    plt.savefig(name, dpi=300, bbox_inches='tight')
-    plt.close()
+    # Reuse the previous render unless the analyzer, parameters or code changed
+    RenderCache().render(
+        f'nballs-{{key}}-{analyzer.__class__.__qualname__}.png', draw,
+        kind=analyzer.__class__.__qualname__,
+        params={'epsilon': analyzer.epsilon, 'n_points': n_points, 'lod': lod, 'dpi': dpi,
+                'views': analyzer.standard_views, 'colormap': cmap.name},
+        sources=package_sources())